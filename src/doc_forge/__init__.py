@@ -14,10 +14,12 @@ Every element of Doc Forge follows the Eidosian philosophy:
 - Self-Awareness as Foundation: A system that understands its own structure
 """
 
+import hashlib
+import json
 import logging
 import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # 📊 Self-aware logging system - the eyes and ears of our architecture
 logging.basicConfig(
@@ -31,24 +33,88 @@ from .version import VERSION as __version__
 from .version import get_version_string
 
 # Core path utilities - foundation of structure, the skeleton of our cathedral
-from .utils.paths import get_repo_root, get_docs_dir
-
-# Documentation management components - the specialized organs of our organism
-from .update_toctrees import update_toctrees
-from .fix_inline_refs import fix_inline_references
-from .doc_validator import validate_docs
-
-# Import more specialized fixers - the surgical instruments of our toolkit
-from .fix_cross_refs import fix_ambiguous_references
-# Import more specialized fixers - the surgical instruments of our toolkit
-from .fix_cross_refs import fix_ambiguous_references
-from .fix_rst_syntax import RstSyntaxPerfector
-from .fix_docstrings import DocstringFixer
-from .fix_duplicate_objects import DuplicateObjectHarmonizer
-try:
-    from .run import main as run_cli
-except ImportError:
-    from .doc_forge import main as run_cli
+from .utils.paths import get_repo_root, get_docs_dir, list_doc_files
+
+# 🧰 Component registry - documentation organs and surgical fixers are imported
+# on first attribute access, so ``import doc_forge`` stays cheap
+_LAZY_EXPORTS: Dict[str, str] = {
+    "update_toctrees": ".update_toctrees",
+    "fix_inline_references": ".fix_inline_refs",
+    "validate_docs": ".doc_validator",
+    "fix_ambiguous_references": ".fix_cross_refs",
+    "RstSyntaxPerfector": ".fix_rst_syntax",
+    "DocstringFixer": ".fix_docstrings",
+    "DuplicateObjectHarmonizer": ".fix_duplicate_objects",
+    "AutoAPIFixer": ".autoapi_fixer",
+}
+
+def __getattr__(name: str) -> Any:
+    """Resolve registry components on first use and cache them on the package."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+# ♻️ Stage memoization (opt-in) - skip docs-only stages whose tree has not
+# moved since they last left it. Stages that read the package sources or
+# README (refs, validate) always run.
+_STAGE_CACHE = Path("~/.cache/doc_forge/stages.json").expanduser()
+_SIGNED_SUFFIXES = (".rst", ".md")
+
+def _docs_signature(docs_dir: Path) -> str:
+    """
+    Fingerprint a documentation tree from its file names and modification times.
+
+    Args:
+        docs_dir: Documentation directory to fingerprint
+
+    Returns:
+        str: Hex digest that changes whenever a source file is added, removed or touched
+    """
+    # One scandir walk - DirEntry types come from the directory listing, and
+    # only matching entries are ever stat'ed or turned into strings
+    stamps = []
+    stack = [os.fspath(docs_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    if os.path.splitext(entry.name)[1] in _SIGNED_SUFFIXES:
+                        try:
+                            stamps.append((entry.path.split(os.sep), f"{entry.path}:{entry.stat().st_mtime_ns}"))
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+    # Component-wise order, as Path sorting gives, keeps signatures stable across versions
+    stamps.sort(key=lambda stamp: stamp[0])
+    digest = hashlib.blake2b(digest_size=16)
+    for _, stamp in stamps:
+        digest.update(stamp.encode())
+    return digest.hexdigest()
+
+def _load_stage_cache() -> Dict[str, Dict[str, str]]:
+    """Load the per-docs-tree stage signatures, tolerating a missing or corrupt cache."""
+    try:
+        return json.loads(_STAGE_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _save_stage_cache(cache: Dict[str, Dict[str, str]]) -> None:
+    """Persist stage signatures; failure only costs us the next run's shortcut."""
+    try:
+        _STAGE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _STAGE_CACHE.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not write stage cache {_STAGE_CACHE}: {e}")
 
 # Core execution entry points
 def main() -> int:
@@ -59,6 +125,10 @@ def main() -> int:
         int: Exit code (0 for success, non-zero for failure)
     """
     logger.debug("🚀 Doc Forge main entry point invoked")
+    try:
+        from .run import main as run_cli
+    except ImportError:
+        from .doc_forge import main as run_cli
     return run_cli()
 
 def forge_docs(
@@ -67,7 +137,8 @@ def forge_docs(
     fix_refs: bool = True, 
     fix_syntax: bool = True,
     fix_duplicates: bool = True,
-    validate: bool = True
+    validate: bool = True,
+    use_cache: bool = False
 ) -> bool:
     """
     One-shot function to update and fix documentation with Eidosian precision.
@@ -82,6 +153,8 @@ def forge_docs(
         fix_syntax: Whether to fix RST syntax issues
         fix_duplicates: Whether to fix duplicate object descriptions
         validate: Whether to validate documentation
+        use_cache: Skip the TOC, syntax and duplicate stages when the docs tree is
+            unchanged since each last succeeded (recorded in ``~/.cache/doc_forge``)
         
     Returns:
         bool: True if all operations succeeded, False otherwise
@@ -98,16 +171,47 @@ def forge_docs(
     success = True
     operations_performed = 0
     
+    # Stages already run successfully against this exact tree can be skipped
+    docs_key = str(docs_dir.resolve())
+    stage_cache = _load_stage_cache() if use_cache else {}
+    stage_sigs = stage_cache.get(docs_key, {})
+    signature = _docs_signature(docs_dir) if use_cache else ""
+    
+    def fresh(stage: str) -> bool:
+        if use_cache and stage_sigs.get(stage) == signature:
+            logger.info(f"♻️ Skipping {stage} - documentation unchanged since last run")
+            return True
+        return False
+    
+    def rewritten(stage: Optional[str] = None) -> None:
+        # A writing stage ran: later stages compare against the tree it left,
+        # and a successful cached stage records that state as its own
+        nonlocal signature
+        if use_cache:
+            signature = _docs_signature(docs_dir)
+            if stage is not None:
+                stage_sigs[stage] = signature
+    
     # Run requested operations - each strike of the hammer must be precise
+    if fix_toc and fresh("toc"):
+        fix_toc = False
     if fix_toc:
         logger.info("📚 Fixing table of contents structure")
+        from .update_toctrees import update_toctrees
         toc_result = update_toctrees(docs_dir)
         success = success and (toc_result >= 0)
         operations_performed += 1
-        
+        rewritten("toc" if toc_result >= 0 else None)
+    
+    # One walk, taken after the TOC stage may have added index files, feeds
+    # every stage that works from a plain file listing
+    doc_files = list_doc_files(docs_dir) if fix_refs or fix_duplicates else []
+    
     if fix_refs:
         logger.info("🔗 Fixing inline references")
-        refs_result = fix_inline_references(docs_dir)
+        from .fix_inline_refs import fix_inline_references
+        from .fix_cross_refs import fix_ambiguous_references
+        refs_result = fix_inline_references(docs_dir, doc_files)
         success = success and (refs_result >= 0)
         
         logger.info("🧩 Resolving ambiguous cross-references")
@@ -117,10 +221,16 @@ def forge_docs(
         except Exception as e:
             logger.error(f"⚠️ Error fixing ambiguous references: {e}")
             success = False
+        rewritten()
     
+    if fix_syntax and fresh("syntax"):
+        fix_syntax = False
     if fix_syntax:
         logger.info("📝 Polishing RST syntax")
         try:
+            from .fix_rst_syntax import RstSyntaxPerfector
+            from .fix_docstrings import DocstringFixer
+            
             syntax_fixer = RstSyntaxPerfector(docs_dir)
             fixed_count = syntax_fixer.fix_inline_text_issues()
             logger.info(f"✓ Fixed RST syntax issues in {fixed_count} files")
@@ -129,23 +239,31 @@ def forge_docs(
             fixed_count = docstring_fixer.fix_all_files()
             logger.info(f"✓ Fixed docstring formatting in {fixed_count} files")
             operations_performed += 2
+            rewritten("syntax")
         except Exception as e:
             logger.error(f"⚠️ Error fixing syntax: {e}")
             success = False
+            rewritten()
     
+    if fix_duplicates and fresh("duplicates"):
+        fix_duplicates = False
     if fix_duplicates:
         logger.info("🧿 Resolving duplicate object descriptions")
         try:
+            from .fix_duplicate_objects import DuplicateObjectHarmonizer
+            
             harmonizer = DuplicateObjectHarmonizer(docs_dir)
-            fixed_count = harmonizer.fix_duplicate_objects()
+            fixed_count = harmonizer.fix_duplicate_objects(doc_files)
             logger.info(f"✓ Harmonized {fixed_count} duplicate objects")
             operations_performed += 1
+            rewritten("duplicates")
         except Exception as e:
             logger.error(f"⚠️ Error fixing duplicates: {e}")
             success = False
         
     if validate:
         logger.info("🔍 Validating documentation integrity")
+        from .doc_validator import validate_docs
         discrepancies = validate_docs(repo_root)
         if discrepancies:
             logger.warning(f"⚠️ Found {sum(len(v) for v in discrepancies.values())} documentation discrepancies")
@@ -154,6 +272,10 @@ def forge_docs(
             logger.info("✓ Documentation validation passed")
         operations_performed += 1
     
+    if use_cache:
+        stage_cache[docs_key] = stage_sigs
+        _save_stage_cache(stage_cache)
+    
     # Final report - the master craftsman's assessment
     if success:
         logger.info(f"✨ Documentation forging complete! Performed {operations_performed} operations successfully")
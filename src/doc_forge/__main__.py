@@ -27,39 +27,13 @@ Examples:
 """
 
 import sys
-import os
 import logging
 
-# Configure logging - the sentient nervous system of our architecture
-logging.basicConfig(
-    level=logging.INFO if not os.environ.get("DOC_FORGE_DEBUG") else logging.DEBUG,
-    format="%(asctime)s [%(levelname)8s] %(message)s (%(filename)s:%(lineno)s)"
-)
-logger = logging.getLogger("doc_forge.__main__")
+# Argument parsing and logging setup live in .run - this stays a thin shim
+from .run import main
+from .version import get_version_string
 
-try:
-    # Import version info first - our temporal anchor
-    from .version import get_version_string
-    
-    # Then try to import our main runner - the heart of our operation
-    try:
-        from .main import main
-    except ImportError:
-        # Fallback chain - like a master finding alternative paths when one is blocked
-        try:
-            from .doc_forge import main
-        except ImportError:
-            # Ultimate fallback - the final sanctuary
-            from .__init__ import main as run_cli
-            main = run_cli
-            
-    logger.debug(f"🌀 Doc Forge v{get_version_string()} module entry point activated")
-    
-except ImportError as e:
-    # Even in failure, maintain elegance and wisdom
-    print(f"🌋 Critical initialization error: {str(e)}")
-    print("💠 Ensure Doc Forge is properly installed or run from source directory.")
-    sys.exit(1)
+logger = logging.getLogger("doc_forge.__main__")
 
 def module_entry_point() -> int:
     """
@@ -85,12 +59,8 @@ def module_entry_point() -> int:
 
 if __name__ == "__main__":
     # Display version banner - our herald announcing our presence!
-    try:
-        print(f"🌀 Doc Forge v{get_version_string()} - Eidosian Documentation System")
-        print("✨ Crafting documentation with precision, structure, flow, and self-awareness")
-    except NameError:
-        # Even without version info, we maintain composure
-        print("🌀 Doc Forge - Eidosian Documentation System")
+    print(f"🌀 Doc Forge v{get_version_string()} - Eidosian Documentation System")
+    print("✨ Crafting documentation with precision, structure, flow, and self-awareness")
     
     # Pass control to our entry point with elegant error capture
     sys.exit(module_entry_point())
@@ -11,14 +11,21 @@ and elegant control.
 Each command is a precision instrument, each workflow a masterpiece of clarity.
 """
 
+import io
+import os
+import functools
+import importlib.util
 import sys
 import time
+import shutil
+import threading
 import argparse
+import collections
 import logging
 import subprocess
-import shlex
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 # Import path utilities for perfect path handling
 from .utils.paths import get_repo_root, get_docs_dir, ensure_dir
@@ -36,86 +43,717 @@ logger = logging.getLogger("doc_forge")
 REPO_ROOT = get_repo_root()
 DOCS_DIR = get_docs_dir()
 BUILD_DIR = DOCS_DIR / "_build"
+DOCTREES_DIR = BUILD_DIR / "doctrees"  # Parsed doctrees shared by every builder
+TEST_DOCTREES_DIR = BUILD_DIR / "doctrees-test"  # Check's -W build alone reads into these
+CHECK_DIGEST_FILE = BUILD_DIR / ".check_digest"  # Source state at the last clean check
+REQUIREMENTS_DIGEST_FILE = BUILD_DIR / ".reqs.sha256"  # Requirements last installed by setup
+OUTPUT_CACHE_DIR = BUILD_DIR / ".cache"  # Latest build per format, kept under --output-cache
+_CACHE_MARKER = ".forge-cache"  # Source key an output dir was last fully built from
+DAEMON_PID_FILE = BUILD_DIR / ".forge.pid"  # Present while a build daemon is serving
+DAEMON_SOCKET = BUILD_DIR / ".forge.sock"
+DAEMON_TIMEOUT = 600  # Seconds a build waits on the daemon before running Sphinx itself
 SCRIPTS_DIR = REPO_ROOT / "scripts"
+CREATE_FILES_SCRIPT = SCRIPTS_DIR / "create_missing_files.sh"
+CROSS_REF_SCRIPT = SCRIPTS_DIR / "update_cross_references.py"
+ORPHAN_SCRIPT = SCRIPTS_DIR / "update_orphan_directives.py"
+# Subprocess argv takes Path objects directly; these string forms are for the
+# places that genuinely need text (the daemon's JSON requests)
+_DOCS_DIR_S = os.fspath(DOCS_DIR)
 
-logger.debug(f"🔍 REPO_ROOT set to: {REPO_ROOT}")
-logger.debug(f"🔍 DOCS_DIR set to: {DOCS_DIR}")
-logger.debug(f"🔍 BUILD_DIR set to: {BUILD_DIR}")
+logger.debug("🔍 REPO_ROOT set to: %s", REPO_ROOT)
+logger.debug("🔍 DOCS_DIR set to: %s", DOCS_DIR)
+logger.debug("🔍 BUILD_DIR set to: %s", BUILD_DIR)
+
+# Paths found missing this run - later probes skip the stat. Whatever creates
+# one of them must discard it again.
+_MISSING_PATHS: Set[str] = set()
+
+def _first_existing(paths: Iterable[Path]) -> Optional[Path]:
+    """Return the first of ``paths`` that exists, remembering the misses."""
+    for path in paths:
+        key = os.fspath(path)
+        if key in _MISSING_PATHS:
+            continue
+        if path.exists():
+            return path
+        _MISSING_PATHS.add(key)
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _resolve_requirements() -> Path:
+    """
+    Locate the docs requirements file once per process.
+
+    Resolution is lazy (first call, not import) so library users never pay for
+    the stats. Falls back to ``docs/requirements.txt`` when no candidate exists.
+    """
+    requirements_path = DOCS_DIR / "requirements.txt"
+    found = _first_existing(
+        (requirements_path, REPO_ROOT / "requirements.txt", REPO_ROOT / "requirements" / "docs.txt")
+    )
+    if found is None:
+        return requirements_path
+    if found != requirements_path:
+        logger.info(f"📄 Using requirements from: {found}")
+    return found
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 🎭 Command execution
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-def run_command(command: Union[List[str], str], cwd: Optional[Path] = None) -> Tuple[int, str, str]:
+# Windows still needs close_fds=True to keep handles out of the child
+_CLOSE_FDS = os.name != "posix"
+
+# Lines of child output kept for callers to inspect; everything is logged
+# live, so only the tail (where Sphinx puts its summaries) is retained
+_OUTPUT_TAIL_LINES = 2000
+
+def _pump(stream: IO[str], buffer: "collections.deque[str]", log: Callable[[str], None]) -> None:
+    """Forward a child's output line by line as it arrives, keeping the tail."""
+    for line in stream:
+        buffer.append(line)
+        log(line.rstrip())
+    stream.close()
+
+class _TailWriter(io.TextIOBase):
+    """
+    Text stream for in-process runs: passes everything straight through to
+    ``tee`` (the real terminal stream) and keeps only the last lines written.
+    """
+
+    def __init__(self, tee: Optional[IO[str]] = None, maxlen: int = _OUTPUT_TAIL_LINES) -> None:
+        super().__init__()
+        self._tee = tee
+        self._lines: "collections.deque[str]" = collections.deque(maxlen=maxlen)
+        self._partial = ""
+        self._lock = threading.Lock()  # print() from another thread lands here too
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if self._tee is not None:
+            self._tee.write(text)
+        with self._lock:
+            *lines, self._partial = (self._partial + text).split("\n")
+            self._lines.extend(line + "\n" for line in lines)
+        return len(text)
+
+    def flush(self) -> None:
+        if self._tee is not None:
+            self._tee.flush()
+
+    def getvalue(self) -> str:
+        return "".join(self._lines) + self._partial
+
+class _LazyJoin:
+    """Log argument that only joins an argv into text if a handler formats it."""
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: Iterable[object]) -> None:
+        self.parts = parts
+
+    def __str__(self) -> str:
+        return " ".join(map(str, self.parts))
+
+def _run(command: List[Union[str, "os.PathLike[str]"]], cwd: Optional[Path] = None,
+         capture: bool = True) -> Tuple[int, str, str]:
+    """Run an argv list and stream its output - the path every ``cmd_*`` takes.
+
+    With ``capture=False`` the child writes straight to our terminal and
+    nothing is kept in memory; the returned stdout/stderr are then empty.
+
+    ⚡ Spawn invariant: no ``preexec_fn``, no ``env`` and, on POSIX,
+    ``close_fds=False`` - so CPython can take its vfork/``posix_spawn`` fast
+    path instead of fork-copying a large parent. That is safe because every
+    descriptor Python opens (including the pipes below) is non-inheritable
+    (PEP 446). ``cwd`` is only passed when it differs from ours, since an
+    explicit ``cwd`` also disqualifies ``posix_spawn``.
+    """
+    logger.debug("Executing: %s", _LazyJoin(command))
     start_time = time.time()
     process_cwd = cwd or REPO_ROOT
-
-    if isinstance(command, str):
-        command = shlex.split(command)
+    spawn_cwd = None if os.path.abspath(process_cwd) == os.getcwd() else process_cwd
 
     try:
+        if not capture:
+            process = subprocess.Popen(command, cwd=spawn_cwd, shell=False, close_fds=_CLOSE_FDS)
+            process.wait()
+            logger.debug("Command completed in %.2fs with code %d", time.time() - start_time, process.returncode)
+            if process.returncode != 0:
+                logger.warning(f"Command exited with non-zero code: {process.returncode}")
+            return process.returncode, "", ""
+
         process = subprocess.Popen(
             command,
-            cwd=process_cwd,
+            cwd=spawn_cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             shell=False,
+            close_fds=_CLOSE_FDS,
             universal_newlines=True
         )
-        stdout, stderr = process.communicate()
+        # Stream both pipes live (progress on stdout, diagnostics on stderr)
+        # instead of buffering everything until the child exits; memory stays
+        # flat however much a large build prints
+        out_buffer: "collections.deque[str]" = collections.deque(maxlen=_OUTPUT_TAIL_LINES)
+        err_buffer: "collections.deque[str]" = collections.deque(maxlen=_OUTPUT_TAIL_LINES)
+        err_reader = threading.Thread(
+            target=_pump, args=(process.stderr, err_buffer, logger.debug), daemon=True
+        )
+        err_reader.start()
+        _pump(process.stdout, out_buffer, logger.info)
+        err_reader.join()
+        process.wait()
+        stdout, stderr = "".join(out_buffer), "".join(err_buffer)
         execution_time = time.time() - start_time
-        logger.debug(f"Command completed in {execution_time:.2f}s with code {process.returncode}")
+        logger.debug("Command completed in %.2fs with code %d", execution_time, process.returncode)
 
         if process.returncode != 0:
             logger.warning(f"Command exited with non-zero code: {process.returncode}")
-            if stderr:
-                logger.debug(f"stderr: {stderr[:500]}...")
 
         return process.returncode, stdout, stderr
     except Exception as e:
         logger.error(f"Command execution failed: {command}, Error: {e}")
         return 1, "", str(e)
 
+def run_command(command: Union[List[str], str], cwd: Optional[Path] = None,
+                capture: bool = True) -> Tuple[int, str, str]:
+    """Public wrapper: accepts a shell-style string as well as an argv list."""
+    if isinstance(command, str):
+        import shlex
+        command = shlex.split(command)
+    return _run(command, cwd, capture)
+
+def _jobs_value(value: str) -> str:
+    """argparse type for ``--jobs``: ``auto`` or a positive worker count."""
+    if value == "auto" or (value.isdigit() and int(value) > 0):
+        return value
+    raise argparse.ArgumentTypeError(f"expected 'auto' or a positive integer, got {value!r}")
+
+def _positive_int(value: str) -> int:
+    """argparse type for worker counts: a positive integer."""
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+
+def _sphinx_jobs(args: argparse.Namespace) -> List[str]:
+    """Sphinx parallelism flag: ``-j auto`` unless ``--jobs N`` caps the worker count."""
+    return ["-j", getattr(args, 'jobs', None) or "auto"]
+
+# Directories this process has already created - a repeat request skips the
+# mkdir syscall. _remove_tree forgets everything under a root it deletes.
+_MADE_DIRS: Set[str] = set()
+_MADE_DIRS_LOCK = threading.Lock()
+
+def _ensure_dir_once(path: Path) -> Path:
+    """``mkdir -p`` that only touches the filesystem the first time per path."""
+    key = os.fspath(path)
+    if key not in _MADE_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        with _MADE_DIRS_LOCK:
+            _MADE_DIRS.add(key)
+    return path
+
+def _forget_dirs(root: Path) -> None:
+    """Drop ``root`` and its descendants from the created-directory memo."""
+    prefix = os.fspath(root)
+    with _MADE_DIRS_LOCK:
+        _MADE_DIRS.difference_update(
+            [d for d in _MADE_DIRS if d == prefix or d.startswith(prefix + os.sep)]
+        )
+
+def _sphinx_doctrees(doctrees: Path = DOCTREES_DIR) -> List[str]:
+    """Point Sphinx at the shared doctree cache so later builders reuse the parse."""
+    _ensure_dir_once(doctrees)
+    return ["-d", os.fspath(doctrees)]
+
+# Sphinx builder behind each output format
+SPHINX_BUILDERS = {"html": "html", "pdf": "latex", "epub": "epub"}
+
+# Command that opens a file in the desktop's default application, per platform
+_OPENERS = {
+    "linux": ("xdg-open",),
+    "darwin": ("open",),
+    "win32": ("cmd", "/c", "start", ""),
+}
+
+def _warm_import(module: str) -> None:
+    """Import ``module`` ahead of need (e.g. on a side thread); failures surface later."""
+    try:
+        importlib.import_module(module)
+    except Exception as e:
+        logger.debug("Warm import of %s failed: %s", module, e)
+
+def _seed_doctrees(output_format: str) -> Path:
+    """
+    Give a concurrently running builder its own doctree cache, seeded from the
+    shared one - two Sphinx processes must never write the same environment.
+    """
+    doctrees = BUILD_DIR / f"doctrees-{output_format}"
+    if DOCTREES_DIR.is_dir():
+        try:
+            shutil.copytree(DOCTREES_DIR, doctrees, dirs_exist_ok=True)
+        except OSError as e:
+            # A half-copied environment is worse than none - Sphinx reads
+            # everything afresh from an empty cache
+            logger.warning(f"⚠️ Could not seed {output_format} doctrees, building from scratch: {e}")
+            _remove_tree(doctrees)
+    return doctrees
+
+def _daemon_build(sphinx_args: List[str]) -> Optional[Tuple[int, str, str]]:
+    """
+    Hand a Sphinx invocation to a running ``doc_forge daemon``.
+
+    Returns ``(code, stdout, stderr)`` like ``_run`` - the daemon sends back
+    the tail of the build's output, which is echoed here as well - or ``None``
+    when no daemon is reachable so the caller runs Sphinx itself.
+    """
+    if not DAEMON_PID_FILE.is_file():
+        return None
+    import json
+    import socket
+    try:
+        os.kill(int(DAEMON_PID_FILE.read_text()), 0)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            # A daemon that is alive but wedged must not hang every build
+            conn.settimeout(DAEMON_TIMEOUT)
+            conn.connect(str(DAEMON_SOCKET))
+            with conn.makefile("rw", encoding="utf-8") as channel:
+                channel.write(json.dumps(sphinx_args) + "\n")
+                channel.flush()
+                reply = json.loads(channel.readline())
+        code, stdout, stderr = int(reply["code"]), reply.get("stdout", ""), reply.get("stderr", "")
+    except socket.timeout:
+        logger.warning(f"⚠️ Build daemon gave no answer within {DAEMON_TIMEOUT}s - running Sphinx here")
+        return None
+    except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+        logger.debug("Build daemon unavailable, spawning Sphinx instead: %s", e)
+        return None
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return code, stdout, stderr
+
+# Sphinx keeps global state and redirect_stdout is process-wide, so in-process
+# runs take turns even when their callers run on a thread pool
+_IN_PROCESS_LOCK = threading.Lock()
+
+def _run_inproc(entry: Callable[[], object], argv: List[str]) -> Tuple[int, str, str]:
+    """
+    Call a Python entry point inside this interpreter, shaped like ``_run``.
+
+    ``sys.argv`` is swapped for ``argv`` and stdout/stderr are captured while
+    still reaching the terminal live, so code written as a command-line tool
+    behaves as if it had been spawned.
+    ``SystemExit`` becomes the return code instead of ending this process.
+    """
+    import contextlib
+    with _IN_PROCESS_LOCK:
+        # Bounded like _run's pipes - a long Sphinx build must not grow memory.
+        # Built under the lock: before it, sys.stdout may be another run's writer
+        out_buffer, err_buffer = _TailWriter(sys.stdout), _TailWriter(sys.stderr)
+        start_time = time.time()
+        saved_argv = sys.argv
+        sys.argv = [str(arg) for arg in argv]
+        with contextlib.redirect_stdout(out_buffer), contextlib.redirect_stderr(err_buffer):
+            try:
+                result = entry()
+                code = result if isinstance(result, int) else 0
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    code = e.code or 0
+                else:
+                    err_buffer.write(f"{e.code}\n")
+                    code = 1
+            except Exception as e:
+                err_buffer.write(f"{e}\n")
+                code = 1
+            finally:
+                sys.argv = saved_argv
+        logger.debug("In-process %s completed in %.2fs with code %s", argv[0], time.time() - start_time, code)
+    return code, out_buffer.getvalue(), err_buffer.getvalue()
+
+def _sphinx_in_process(sphinx_args: List[str]) -> Optional[Tuple[int, str, str]]:
+    """Run ``sphinx-build`` inside this interpreter, or ``None`` if Sphinx isn't importable."""
+    # A missing Sphinx is remembered by the cached spec lookup, so repeat
+    # builds skip straight to the subprocess fallback without another import scan
+    if not _have_module("sphinx"):
+        return None
+    try:
+        from sphinx.cmd.build import build_main
+    except ImportError:
+        return None
+    return _run_inproc(lambda: build_main(sphinx_args), ["sphinx-build", *sphinx_args])
+
+@functools.lru_cache(maxsize=None)
+def _script_path(script: Path) -> Optional[Path]:
+    """``script`` if it exists - probed once per process, misses included."""
+    return script if script.is_file() else None
+
+def _script(script: Path, script_args: List[Union[str, "os.PathLike[str]"]],
+            args: argparse.Namespace) -> Tuple[int, str, str]:
+    """Run one of the repo's helper scripts in-process, or spawned under ``--subprocess``."""
+    if _script_path(script) is None:
+        return 1, "", f"{script} not found"
+    if getattr(args, 'subprocess', False):
+        return _run([sys.executable, script, *script_args])
+    import runpy
+
+    def entry() -> None:
+        # A spawned script sees its own directory first on sys.path - mirror that
+        sys.path.insert(0, os.fspath(script.parent))
+        try:
+            runpy.run_path(os.fspath(script), run_name="__main__")
+        finally:
+            sys.path.remove(os.fspath(script.parent))
+
+    return _run_inproc(entry, [script, *script_args])
+
+def _sphinx(sphinx_args: List[str], args: argparse.Namespace,
+            capture: bool = True) -> Tuple[int, str, str]:
+    """
+    Run one ``sphinx-build`` invocation by the cheapest available route.
+
+    A running build daemon is tried first, then Sphinx in this process; a fresh
+    ``python -m sphinx`` is spawned only as the fallback or under ``--subprocess``
+    (for extensions that call ``sys.exit`` or patch the interpreter). A spawned
+    build run with ``capture=False`` prints to the terminal instead of a pipe.
+    """
+    if not getattr(args, 'subprocess', False):
+        result = _daemon_build(sphinx_args)
+        if result is not None:
+            return result
+        result = _sphinx_in_process(sphinx_args)
+        if result is not None:
+            return result
+    return _run([sys.executable, "-m", "sphinx", *sphinx_args], capture=capture)
+
+def _source_key(roots: Optional[Iterable[Path]] = None) -> str:
+    """
+    Hash everything a build reads - the docs tree (minus ``_build``), the
+    package sources autodoc imports, and the Sphinx version - from stat data alone.
+
+    ``roots`` narrows the walk, e.g. to just the package sources.
+    """
+    import hashlib
+    from importlib import metadata
+    try:
+        sphinx_version = metadata.version("sphinx")
+    except metadata.PackageNotFoundError:
+        sphinx_version = "unknown"
+    fingerprint = hashlib.blake2b(sphinx_version.encode(), digest_size=16)
+    build_dir = os.fspath(BUILD_DIR)
+    skip = lambda entry: entry.name == "__pycache__" or entry.path == build_dir
+    stamps = []
+    for root in roots or (DOCS_DIR, REPO_ROOT / "src"):
+        if not root.is_dir():
+            continue
+        for entry in _scandir_walk(root, prune=skip):
+            if entry.is_file(follow_symlinks=False):
+                info = entry.stat(follow_symlinks=False)
+                stamps.append(f"{entry.path}\0{info.st_mtime_ns}\0{info.st_size}")
+    fingerprint.update("\n".join(sorted(stamps)).encode("utf-8", "surrogateescape"))
+    return fingerprint.hexdigest()
+
+def _output_key(build_dir: Path) -> Optional[str]:
+    """Source key of the build an output dir currently holds, per its marker."""
+    try:
+        return (build_dir / _CACHE_MARKER).read_text()
+    except OSError:
+        return None
+
+def _restore_cached(output_format: str, key: Optional[str], build_dir: Path) -> bool:
+    """Copy the cached build of this exact source state into ``build_dir``, if there is one."""
+    if key is None:
+        return False
+    cached = OUTPUT_CACHE_DIR / key / output_format
+    if not cached.is_dir():
+        return False
+    _remove_tree(build_dir)
+    # copy2 keeps the cached mtimes, so the next real build still sees which
+    # sources are newer than their outputs
+    shutil.copytree(cached, build_dir)
+    (build_dir / _CACHE_MARKER).write_text(key)
+    return True
+
+def _store_cached(output_format: str, key: Optional[str], build_dir: Path) -> None:
+    """Copy a fresh build into the output cache and evict every other source state."""
+    if key is None:
+        return
+    cached = OUTPUT_CACHE_DIR / key / output_format
+    staging = cached.with_name(f"{output_format}.tmp-{os.getpid()}-{threading.get_ident()}")
+    try:
+        shutil.copytree(build_dir, staging, ignore=shutil.ignore_patterns(_CACHE_MARKER))
+        if cached.exists():
+            _remove_tree(cached)
+        os.replace(staging, cached)
+    except OSError as e:
+        logger.debug("Could not cache %s output: %s", output_format, e)
+        _remove_tree(staging)
+        return
+
+    # Only the latest build is worth keeping - a clean may be racing us here
+    try:
+        with os.scandir(OUTPUT_CACHE_DIR) as entries:
+            stale = [Path(entry.path) for entry in entries if entry.name != key]
+    except FileNotFoundError:
+        return
+    for entry in stale:
+        logger.debug("🗑️ Evicting cached output: %s", entry.name)
+        _remove_tree(entry)
+
+def _reuse_output(output_format: str, args: argparse.Namespace, key: Optional[str]) -> bool:
+    """True if ``output_format`` needs no Sphinx run for source state ``key`` - up to date or restored."""
+    build_dir = BUILD_DIR / output_format
+    if getattr(args, 'skip_unchanged', False) and key is not None and _output_key(build_dir) == key:
+        logger.info(f"♻️ {output_format.upper()} output is already up to date - nothing to do")
+        return True
+    if getattr(args, 'output_cache', False) and _restore_cached(output_format, key, build_dir):
+        logger.info(f"♻️ {output_format.upper()} unchanged since the cached build - restored from cache")
+        return True
+    return False
+
+def _build_one(output_format: str, args: argparse.Namespace, doctrees: Path = DOCTREES_DIR,
+               key: Optional[str] = None) -> int:
+    """
+    Build a single output format (plus the LaTeX-to-PDF step) and return its exit code.
+
+    Callers settle reuse first (see ``_reuse_output``); this always runs Sphinx.
+    A source ``key`` is recorded in the output dir once the build succeeds, and
+    under ``--output-cache`` the result is copied into the cache.
+    """
+    build_dir = BUILD_DIR / output_format
+    output_cache = getattr(args, 'output_cache', False)
+    logger.info(f"📚 Building {output_format.upper()} documentation")
+    _ensure_dir_once(build_dir)
+    # Sphinx builds incrementally on top of the old output; only the marker
+    # goes, so an interrupted build never passes for an up-to-date one
+    (build_dir / _CACHE_MARKER).unlink(missing_ok=True)
+    sphinx_args = [
+        *_sphinx_jobs(args), *_sphinx_doctrees(doctrees),
+        "-b", SPHINX_BUILDERS[output_format],
+        _DOCS_DIR_S, os.fspath(build_dir)
+    ]
+    # A spawned Sphinx prints its diagnostics live rather than through err
+    code, _, err = _sphinx(sphinx_args, args, capture=False)
+
+    if code != 0:
+        logger.error(f"❌ {output_format.upper()} build failed: {err or f'exit code {code}'}")
+        return code
+
+    logger.info(f"✅ {output_format.upper()} build completed successfully")
+
+    if output_format == "pdf":
+        logger.info("📄 Running LaTeX build to generate PDF")
+        code, _, err = _run(["make", "-C", build_dir, "all-pdf"])
+        if code != 0:
+            logger.error(f"❌ PDF generation failed: {err}")
+            return code
+        logger.info("✅ PDF generation completed successfully")
+
+    if key is not None:
+        (build_dir / _CACHE_MARKER).write_text(key)
+        if output_cache:
+            _store_cached(output_format, key, build_dir)
+    return 0
+
+def _scandir_walk(root: Path, prune: Optional[Callable[[os.DirEntry], bool]] = None) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below ``root`` from one ``os.scandir`` pass, using cached ``DirEntry`` types.
+
+    Directories for which ``prune`` returns True are still yielded but never descended into.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and not (prune and prune(entry)):
+                        stack.append(entry.path)
+                    yield entry
+        except OSError as e:
+            logger.debug("Skipping unreadable directory: %s", e)
+
+def _docs_digest(root: Path) -> Tuple[str, int, int]:
+    """
+    Fingerprint the sources ``check`` depends on from one stat-only walk.
+
+    Returns:
+        (digest over path/mtime/size of every .md/.rst/conf.py, Markdown count, RST count)
+    """
+    import hashlib
+    fingerprint = hashlib.blake2b(digest_size=16)
+    stamps = []
+    markdown = rst = 0
+    build_dir = os.fspath(BUILD_DIR)
+    for entry in _scandir_walk(root, prune=lambda entry: entry.path == build_dir):
+        name = entry.name
+        if name.endswith(".md"):
+            kind = "md"
+        elif name.endswith(".rst"):
+            kind = "rst"
+        elif name == "conf.py":
+            kind = "conf"
+        else:
+            continue
+        if not entry.is_file():
+            continue
+        markdown += kind == "md"
+        rst += kind == "rst"
+        info = entry.stat()
+        stamps.append(f"{entry.path}\0{info.st_mtime_ns}\0{info.st_size}")
+    # scandir order is filesystem-dependent - sort so the digest is stable
+    fingerprint.update("\n".join(sorted(stamps)).encode("utf-8", "surrogateescape"))
+    return fingerprint.hexdigest(), markdown, rst
+
+_UNLINK_BATCH = 1024  # Files handed to one deletion task
+# unlinkat(2) relative to an open directory skips re-resolving the full path per file
+_UNLINK_AT = os.unlink in os.supports_dir_fd
+
+def _unlink_batch(groups: List[Tuple[str, List[str]]]) -> None:
+    """Unlink ``(directory, names)`` groups, opening each directory once."""
+    for directory, names in groups:
+        dir_fd = None
+        if _UNLINK_AT:
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            except OSError:
+                pass
+        try:
+            for name in names:
+                try:
+                    if dir_fd is None:
+                        os.unlink(os.path.join(directory, name))
+                    else:
+                        os.unlink(name, dir_fd=dir_fd)
+                except OSError:
+                    pass
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+def _remove_tree(root: Path) -> None:
+    """
+    Delete a large tree with batched, threaded unlinks.
+
+    One scandir walk collects every file grouped by directory, batches of
+    unlinks (each relative to an open directory fd) run on a thread pool, then
+    directories are removed deepest-first. Only when the root will not go
+    (odd permissions, races) does ``shutil.rmtree`` walk it again.
+    """
+    _forget_dirs(root)
+    files: Dict[str, List[str]] = {}
+    dirs: List[str] = []
+    for entry in _scandir_walk(root):
+        if entry.is_dir(follow_symlinks=False):
+            dirs.append(entry.path)
+        else:
+            files.setdefault(os.path.dirname(entry.path), []).append(entry.name)
+
+    batches: List[List[Tuple[str, List[str]]]] = [[]]
+    batch_size = 0
+    for directory, names in files.items():
+        for i in range(0, len(names), _UNLINK_BATCH):
+            chunk = names[i:i + _UNLINK_BATCH]
+            if batch_size + len(chunk) > _UNLINK_BATCH and batch_size:
+                batches.append([])
+                batch_size = 0
+            batches[-1].append((directory, chunk))
+            batch_size += len(chunk)
+
+    if len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(batches))) as pool:
+            list(pool.map(_unlink_batch, batches))
+    else:
+        _unlink_batch(batches[0])
+
+    for directory in sorted(dirs, key=lambda d: d.count(os.sep), reverse=True):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+    try:
+        os.rmdir(root)
+        return  # Emptied cleanly - no second walk needed
+    except FileNotFoundError:
+        return
+    except OSError:
+        pass
+    shutil.rmtree(root, ignore_errors=True)
+
+@functools.lru_cache(maxsize=None)
+def _have_module(name: str) -> bool:
+    """In-process import probe, answered once per process (until an install)."""
+    return importlib.util.find_spec(name) is not None
+
+# Tools commands need beyond the requirements file - distribution -> import name
+_REQUIRED_EXTRAS = {"sphinx-autobuild": "sphinx_autobuild"}
+
+def _ensure_packages(packages: Dict[str, str], *pip_args: Union[str, "os.PathLike[str]"]) -> int:
+    """
+    Install every package that fails to import, plus any extra ``pip install``
+    arguments (e.g. ``-r requirements.txt``), in a single pip run.
+
+    Returns pip's exit code, or 0 when there was nothing to install.
+    """
+    missing = [dist for dist, module in packages.items() if not _have_module(module)]
+    if not missing and not pip_args:
+        return 0
+    # pip's progress and errors go straight to the terminal
+    code, _, _ = _run([sys.executable, "-m", "pip", "install", *pip_args, *missing], capture=False)
+    # Let later probes see what was just installed
+    importlib.invalidate_caches()
+    _have_module.cache_clear()
+    return code
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 📋 Command implementations
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 def cmd_setup(args: argparse.Namespace) -> int:
     logger.info("🏗️ Setting up documentation environment")
-    requirements_path = DOCS_DIR / "requirements.txt"
-
-    if not requirements_path.exists():
-        alt_paths = [
-            REPO_ROOT / "requirements.txt",
-            REPO_ROOT / "requirements" / "docs.txt",
-        ]
-        for path in alt_paths:
-            if path.exists():
-                requirements_path = path
-                logger.info(f"📄 Using requirements from: {requirements_path}")
-                break
+    requirements_path = _resolve_requirements()
 
     if not requirements_path.exists():
         logger.warning("⚠️ No requirements file found. Creating minimal one.")
         ensure_dir(requirements_path.parent)
         with open(requirements_path, "w") as f:
             f.write("# Documentation dependencies\nsphinx>=4.0.0\nsphinx-rtd-theme>=1.0.0\n")
+        _MISSING_PATHS.discard(os.fspath(requirements_path))
 
-    logger.info("📦 Installing Python dependencies")
-    code, _, err = run_command([sys.executable, "-m", "pip", "install", "-r", str(requirements_path)])
+    # The interpreter is part of the digest - a new virtualenv needs its own install
+    import hashlib
+    reqs_digest = hashlib.sha256(requirements_path.read_bytes() + os.fsencode(sys.executable)).hexdigest()
+    try:
+        installed_digest = REQUIREMENTS_DIGEST_FILE.read_text()
+    except OSError:
+        installed_digest = None
+
+    if installed_digest == reqs_digest and not getattr(args, 'force_setup', False):
+        logger.info("♻️ Requirements unchanged since the last setup - skipping pip (use --force-setup to reinstall)")
+        code = _ensure_packages(_REQUIRED_EXTRAS)
+    else:
+        logger.info("📦 Installing Python dependencies")
+        # One resolver run covers the requirements file and any missing extras
+        code = _ensure_packages(_REQUIRED_EXTRAS, "-r", requirements_path)
+        if code == 0:
+            _ensure_dir_once(BUILD_DIR)
+            REQUIREMENTS_DIGEST_FILE.write_text(reqs_digest)
     if code != 0:
-        logger.error(f"❌ Failed to install dependencies: {err}")
+        logger.error(f"❌ Failed to install dependencies (pip exited with {code})")
         return code
 
     logger.info("📂 Creating directory structure")
-    code, _, err = run_command(["chmod", "+x", str(SCRIPTS_DIR / "create_missing_files.sh")])
-    if code == 0:
-        code, _, err = run_command([str(SCRIPTS_DIR / "create_missing_files.sh")])
+    if _first_existing((CREATE_FILES_SCRIPT,)) is None:
+        logger.error(f"❌ Failed to create directory structure: {CREATE_FILES_SCRIPT} not found")
+        return 1
+    # Hand the script to its interpreter directly - no execute bit needed, so
+    # no chmod step (the script uses bash's echo -e, hence not plain sh)
+    code, _, err = _run(["bash", CREATE_FILES_SCRIPT])
 
     if code != 0:
         logger.error(f"❌ Failed to create directory structure: {err}")
         return code
 
-    BUILD_DIR.mkdir(exist_ok=True, parents=True)
-    (BUILD_DIR / "html").mkdir(exist_ok=True)
+    _ensure_dir_once(BUILD_DIR / "html")
 
     logger.info("✅ Documentation environment setup complete")
     return 0
@@ -125,83 +763,99 @@ def cmd_build(args: argparse.Namespace) -> int:
     fix = getattr(args, 'fix', False)
     open_after = getattr(args, 'open', False)
 
+    builds = []
+    for output_format in formats:
+        if output_format not in SPHINX_BUILDERS:
+            logger.error(f"❌ Unknown output format: {output_format}")
+            continue
+        builds.append(output_format)
+
     if fix:
         logger.info("🔧 Fixing documentation issues")
+        # The fixers rewrite the same files, so they stay in sequence - but
+        # loading Sphinx for the in-process build touches no docs and overlaps them
+        warmup = None
+        if not getattr(args, 'subprocess', False) and _have_module("sphinx"):
+            warmup = threading.Thread(target=_warm_import, args=("sphinx.cmd.build",), daemon=True)
+            warmup.start()
         logger.info("🔗 Fixing cross-references")
-        code, _, err = run_command([sys.executable, str(SCRIPTS_DIR / "update_cross_references.py"), str(DOCS_DIR)])
+        code, _, err = _script(CROSS_REF_SCRIPT, [DOCS_DIR], args)
         if code != 0:
             logger.warning(f"⚠️ Cross-reference fixing had issues: {err}")
 
         logger.info("🏝️ Adding orphan directives to standalone files")
-        code, _, err = run_command([sys.executable, str(SCRIPTS_DIR / "update_orphan_directives.py"), str(DOCS_DIR)])
+        code, _, err = _script(ORPHAN_SCRIPT, [DOCS_DIR], args)
         if code != 0:
             logger.warning(f"⚠️ Orphan directive addition had issues: {err}")
+        if warmup is not None:
+            # Never fork the build pool while a thread may hold the import lock
+            warmup.join()
 
-    for output_format in formats:
-        logger.info(f"📚 Building {output_format.upper()} documentation")
-        build_dir = BUILD_DIR / output_format
-        build_dir.mkdir(exist_ok=True, parents=True)
-        cmd = [sys.executable, "-m", "sphinx"]
-
-        if output_format == "html":
-            cmd.extend(["-b", "html"])
-        elif output_format == "pdf":
-            cmd.extend(["-b", "latex"])
-        elif output_format == "epub":
-            cmd.extend(["-b", "epub"])
-        else:
-            logger.error(f"❌ Unknown output format: {output_format}")
-            continue
-
-        cmd.extend([str(DOCS_DIR), str(build_dir)])
-        code, _, err = run_command(cmd)
+    # Opt-in: one stat walk decides which formats are up to date or cached
+    # already (installed themes and extensions are not part of the key)
+    reuse = getattr(args, 'skip_unchanged', False) or getattr(args, 'output_cache', False)
+    key = _source_key() if reuse and builds else None
+    pending = [fmt for fmt in builds if not _reuse_output(fmt, args, key)]
 
+    if len(pending) == 1:
+        code = _build_one(pending[0], args, key=key)
         if code != 0:
-            logger.error(f"❌ {output_format.upper()} build failed: {err}")
             return code
-
-        logger.info(f"✅ {output_format.upper()} build completed successfully")
-
-        if output_format == "pdf":
-            logger.info("📄 Running LaTeX build to generate PDF")
-            code, _, err = run_command(["make", "-C", str(build_dir), "all-pdf"])
-            if code != 0:
-                logger.error(f"❌ PDF generation failed: {err}")
-                return code
-            logger.info("✅ PDF generation completed successfully")
+    elif pending:
+        # Builders are independent - each gets its own process, so in-process
+        # Sphinx runs side by side instead of taking turns on _IN_PROCESS_LOCK.
+        # The first keeps the shared doctrees, the others work on seeded copies.
+        doctrees = [DOCTREES_DIR] + [_seed_doctrees(fmt) for fmt in pending[1:]]
+        failed = 0
+        workers = getattr(args, 'max_workers', None) or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(len(pending), workers)) as pool:
+            futures = {
+                pool.submit(_build_one, fmt, args, tree, key): fmt
+                for fmt, tree in zip(pending, doctrees)
+            }
+            for future in as_completed(futures):
+                code = future.result()
+                logger.debug("%s worker finished with code %s", futures[future].upper(), code)
+                failed = failed or code
+        if failed:
+            return failed
 
     if open_after:
         html_index = BUILD_DIR / "html" / "index.html"
         if html_index.exists():
             logger.info(f"🌐 Opening documentation: {html_index}")
-            if sys.platform == "linux":
-                run_command(["xdg-open", str(html_index)])
-            elif sys.platform == "darwin":
-                run_command(["open", str(html_index)])
-            elif sys.platform == "win32":
-                run_command(["start", str(html_index)], shell=True)
+            opener = _OPENERS.get(sys.platform)
+            if opener is not None:
+                _run([*opener, html_index])
 
     logger.info(f"📚 Documentation build complete. Output in: {BUILD_DIR}")
     return 0
 
 def cmd_clean(_: argparse.Namespace) -> int:
     logger.info("🧹 Cleaning documentation build artifacts")
-    import shutil
 
     try:
+        # Deletion is syscall-bound and releases the GIL: the big build trees
+        # start going at once, and each __pycache__ is queued the moment the
+        # discovery walk finds it instead of after the walk ends
+        roots: List[Path] = []
         if BUILD_DIR.exists():
             logger.info(f"🗑️ Removing build directory: {BUILD_DIR}")
-            shutil.rmtree(BUILD_DIR, ignore_errors=True)
+            roots.append(BUILD_DIR)  # Doctrees and caches live inside it
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            removals = [pool.submit(_remove_tree, root) for root in roots]
 
-        doctrees = DOCS_DIR / "_build" / "doctrees"
-        if doctrees.exists():
-            logger.info(f"🗑️ Removing doctrees: {doctrees}")
-            shutil.rmtree(doctrees, ignore_errors=True)
+            # Never descend into the tree that is being deleted wholesale anyway
+            build_dir = os.fspath(BUILD_DIR)
+            skip = lambda entry: entry.name == "__pycache__" or entry.path == build_dir
+            for entry in _scandir_walk(DOCS_DIR, prune=skip):
+                if entry.name == "__pycache__" and entry.is_dir(follow_symlinks=False):
+                    logger.debug("🗑️ Removing __pycache__: %s", entry.path)
+                    removals.append(pool.submit(_remove_tree, Path(entry.path)))
 
-        for pycache in DOCS_DIR.glob("**/__pycache__"):
-            if pycache.is_dir():
-                logger.debug(f"🗑️ Removing __pycache__: {pycache}")
-                shutil.rmtree(pycache, ignore_errors=True)
+            for removal in removals:
+                removal.result()
 
         logger.info("✅ Clean operation completed successfully")
         return 0
@@ -211,71 +865,114 @@ def cmd_clean(_: argparse.Namespace) -> int:
 
 def cmd_check(args: argparse.Namespace) -> int:
     logger.info("🔍 Checking documentation for issues")
-    markdown_files = list(DOCS_DIR.glob("**/*.md"))
-    rst_files = list(DOCS_DIR.glob("**/*.rst"))
-    total_files = len(markdown_files) + len(rst_files)
-    logger.info(f"📊 Found {total_files} documentation files ({len(markdown_files)} Markdown, {len(rst_files)} RST)")
+    digest, markdown_count, rst_count = _docs_digest(DOCS_DIR)
+    total_files = markdown_count + rst_count
+    logger.info(f"📊 Found {total_files} documentation files ({markdown_count} Markdown, {rst_count} RST)")
+
+    # Opt-in: nothing touched since the last fully clean check - skip the
+    # network-bound linkcheck (external links going dead go unnoticed)
+    linkcheck_output = BUILD_DIR / "linkcheck" / "output.json"
+    if getattr(args, 'skip_unchanged', False) and linkcheck_output.is_file():
+        try:
+            if CHECK_DIGEST_FILE.read_text().strip() == digest:
+                logger.info("✅ No changes since the last clean check - skipping")
+                return 0
+        except OSError:
+            pass
 
+    # The three checks are independent (unlike build --fix, whose helpers
+    # rewrite the same files), so they are submitted together. Sphinx only
+    # warns about a document while reading it, so the -W build never shares
+    # doctrees another builder has already brought up to date.
     logger.info("🔗 Checking for broken references")
-    code, _, err = run_command([
-        sys.executable, "-m", "sphinx.ext.intersphinx",
-        str(DOCS_DIR / "conf.py")
-    ])
+    logger.info("🔍 Running link check")
+    logger.info("⚠️ Running test build with warnings-as-errors")
+    linkcheck_args = [
+        *_sphinx_jobs(args), *_sphinx_doctrees(), "-b", "linkcheck",
+        _DOCS_DIR_S, os.fspath(BUILD_DIR / "linkcheck")
+    ]
+    test_args = [
+        *_sphinx_jobs(args), *_sphinx_doctrees(TEST_DOCTREES_DIR), "-b", "html", "-W",
+        _DOCS_DIR_S, os.fspath(BUILD_DIR / "test")
+    ]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        intersphinx_future = pool.submit(
+            _run, [sys.executable, "-m", "sphinx.ext.intersphinx", DOCS_DIR / "conf.py"]
+        )
+        linkcheck_future = pool.submit(_sphinx, linkcheck_args, args)
+        test_future = pool.submit(_sphinx, test_args, args)
+        intersphinx_result = intersphinx_future.result()
+        linkcheck_result = linkcheck_future.result()
+        test_result = test_future.result()
+
+    code, _, err = intersphinx_result
     if code != 0:
         logger.warning(f"⚠️ Intersphinx check had issues: {err}")
 
-    logger.info("🔍 Running link check")
-    code, _, err = run_command([
-        sys.executable, "-m", "sphinx", "-b", "linkcheck",
-        str(DOCS_DIR), str(BUILD_DIR / "linkcheck")
-    ])
+    code, _, err = linkcheck_result
+    links_clean = code == 0 and "broken links found" not in err
     if "broken links found" in err:
         logger.warning("⚠️ Broken links detected")
         for line in err.splitlines():
             if "broken" in line or "error" in line.lower():
                 logger.warning(f"  {line}")
 
-    logger.info("⚠️ Running test build with warnings-as-errors")
-    code, _, err = run_command([
-        sys.executable, "-m", "sphinx", "-b", "html", "-W",
-        str(DOCS_DIR), str(BUILD_DIR / "test")
-    ])
+    code, _, err = test_result
     if code != 0:
         logger.error("❌ Test build failed - documentation has warnings that would be errors")
         for line in err.splitlines():
             if "WARNING:" in line:
                 logger.warning(f"  {line}")
-        return code
+        # Documents read during a failed run must be read (and warned about) again
+        _remove_tree(TEST_DOCTREES_DIR)
     else:
         logger.info("✅ Test build passed - documentation has no critical warnings")
 
+    # Only a check with clean links and a passing test build may be skipped next time
+    try:
+        if links_clean and code == 0:
+            CHECK_DIGEST_FILE.write_text(digest)
+        elif CHECK_DIGEST_FILE.exists():
+            CHECK_DIGEST_FILE.unlink()
+    except OSError as e:
+        logger.debug("Could not update check digest: %s", e)
+    if code != 0:
+        return code
+
     logger.info("✅ Documentation check completed")
     return 0
 
 def cmd_serve(args: argparse.Namespace) -> int:
     port = getattr(args, 'port', 8000)
 
-    code, _, err = run_command([
-        sys.executable, "-c",
-        "import sphinx_autobuild; print('sphinx-autobuild is available')"
-    ])
-    if code != 0:
+    # In-process probe - no interpreter start-up just to test an import
+    if not _have_module("sphinx_autobuild"):
         logger.error("❌ sphinx-autobuild is not available, trying to install it")
-        code, _, err = run_command([
-            sys.executable, "-m", "pip", "install", "sphinx-autobuild"
-        ])
+        code = _ensure_packages(_REQUIRED_EXTRAS)
         if code != 0:
-            logger.error(f"❌ Failed to install sphinx-autobuild: {err}")
+            logger.error(f"❌ Failed to install sphinx-autobuild (pip exited with {code})")
             return code
 
     logger.info(f"🌐 Starting documentation server on port {port}")
     logger.info("📋 Press Ctrl+C to stop the server")
     cmd = [
         sys.executable, "-m", "sphinx_autobuild",
-        str(DOCS_DIR), str(BUILD_DIR / "html"),
+        DOCS_DIR, BUILD_DIR / "html",
         "--port", str(port),
-        "--open-browser"
+        "--open-browser",
+        *_sphinx_jobs(args)
     ]
+    if sys.platform != "win32":
+        # Nothing left for us to do - become the server (same PID, one
+        # interpreter, Ctrl+C delivered straight to autobuild)
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        try:
+            os.execv(sys.executable, [os.fspath(part) for part in cmd])
+        except OSError as e:
+            logger.error(f"❌ Failed to start documentation server: {e}")
+            return 1
+
     try:
         process = subprocess.Popen(cmd)
         process.wait()
@@ -287,9 +984,100 @@ def cmd_serve(args: argparse.Namespace) -> int:
         logger.error(f"❌ Failed to start documentation server: {e}")
         return 1
 
+def _forget_modules(root: Path) -> int:
+    """Drop every imported module loaded from under ``root``, so the next import reads it afresh."""
+    prefix = os.path.join(os.fspath(root), "")
+    stale = [name for name, module in list(sys.modules.items())
+             if (getattr(module, "__file__", None) or "").startswith(prefix)]
+    for name in stale:
+        sys.modules.pop(name, None)
+    return len(stale)
+
+def cmd_daemon(_: argparse.Namespace) -> int:
+    """
+    Keep Sphinx imported and serve ``build`` requests over a UNIX socket.
+
+    Each request is one JSON line holding ``sphinx-build`` arguments; the reply
+    is ``{"code": N, "stdout": ..., "stderr": ...}`` with the tail of the
+    build's output. Requests run one at a time - a Sphinx application is not
+    safe to share between threads. When the package sources change between
+    requests, the modules imported from them are dropped so autodoc
+    documents the current code.
+    """
+    import json
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        logger.error("❌ The build daemon needs UNIX domain sockets")
+        return 1
+    try:
+        from sphinx.cmd.build import build_main
+    except ImportError as e:
+        logger.error(f"❌ Sphinx is not importable: {e}")
+        return 1
+
+    _ensure_dir_once(BUILD_DIR)
+    if DAEMON_SOCKET.exists():
+        DAEMON_SOCKET.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(DAEMON_SOCKET))
+        server.listen()
+        DAEMON_PID_FILE.write_text(str(os.getpid()))
+        logger.info(f"🔥 Build daemon ready on {DAEMON_SOCKET} (Ctrl+C to stop)")
+        sources = REPO_ROOT / "src"
+        sources_key = _source_key((sources,))
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rw", encoding="utf-8") as channel:
+                stdout = stderr = ""
+                try:
+                    sphinx_args = json.loads(channel.readline())
+                    logger.info("📚 Daemon build: %s", _LazyJoin(sphinx_args))
+                    current_key = _source_key((sources,))
+                    if current_key != sources_key:
+                        dropped = _forget_modules(sources)
+                        logger.info("♻️ Package sources changed - dropped %d cached modules", dropped)
+                        sources_key = current_key
+                    code, stdout, stderr = _run_inproc(
+                        lambda: build_main(sphinx_args), ["sphinx-build", *sphinx_args]
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Daemon build failed: {e}")
+                    code, stderr = 1, f"{e}\n"
+                try:
+                    channel.write(json.dumps({"code": code, "stdout": stdout, "stderr": stderr}) + "\n")
+                    channel.flush()
+                except OSError as e:
+                    logger.warning(f"⚠️ Client went away before the reply: {e}")
+    except KeyboardInterrupt:
+        logger.info("🛑 Build daemon stopped")
+        return 0
+    except OSError as e:
+        logger.error(f"❌ Build daemon failed: {e}")
+        return 1
+    finally:
+        server.close()
+        for path in (DAEMON_PID_FILE, DAEMON_SOCKET):
+            if path.exists():
+                path.unlink()
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 📚 CLI infrastructure
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BANNER = r"""
+╔═════════════════════════════════════════════════════════════════════════════════╗
+║   ██████╗   █████╗   ██████╗    ███████╗  ██████╗  ██████╗   ██████╗  ███████╗  ║
+║   ██╔══██╗ ██╔══██╗ ██╔════╝    ██╔════╝ ██╔═══██╗ ██╔══██╗ ██╔════╝  ██╔════╝  ║
+║   ██║  ██║ ██║  ██║ ██║         █████╗   ██║   ██║ ██████╔╝ ██║  ███╗ ██████║   ║
+║   ██║  ██║ ██║  ██║ ██║         ██╔══╝   ██║   ██║ ██╔══██╗ ██║   ██║ ██║       ║
+║   ██████╔╝ ╚█████╔╝ ╚██████╗    ██║      ╚██████╔╝ ██║  ██║ ╚██████╔╝ ███████╗  ║
+║   ╚═════╝   ╚════╝   ╚═════╝    ╚═╝       ╚═════╝  ╚═╝  ╚═╝  ╚═════╝  ╚══════╝  ║
+╟─────────────────────────────────────────────────────────────────────────────────╢
+║            Eidosian Documentation Command Center                                ║
+╚═════════════════════════════════════════════════════════════════════════════════╝
+"""
+_BANNER_BYTES = BANNER.encode("utf-8")
+
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="🌀 Doc Forge - Universal Documentation Command System",
@@ -298,7 +1086,10 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-    subparsers.add_parser('setup', help='Set up documentation environment')
+    setup_parser = subparsers.add_parser('setup', help='Set up documentation environment')
+    setup_parser.add_argument('--force-setup', action='store_true',
+                              help='Reinstall requirements even if they are unchanged since the last setup')
+    setup_parser.set_defaults(func=cmd_setup)
 
     build_parser = subparsers.add_parser('build', help='Build documentation')
     build_parser.add_argument('-f', '--formats', nargs='+', choices=['html', 'pdf', 'epub'],
@@ -307,27 +1098,46 @@ def create_parser() -> argparse.ArgumentParser:
                               help='Fix documentation issues before building')
     build_parser.add_argument('--open', action='store_true',
                               help='Open documentation after building')
+    build_parser.add_argument('--max-workers', type=_positive_int, metavar='N',
+                              help='Output formats built at once (default: CPU count)')
+    build_parser.add_argument('--skip-unchanged', action='store_true',
+                              help='Skip formats already built from the current docs and sources '
+                                   '(upgraded themes or extensions are not noticed)')
+    build_parser.add_argument('--output-cache', action='store_true',
+                              help='Keep a copy of the latest build and restore it when the '
+                                   'sources return to that state')
+    build_parser.set_defaults(func=cmd_build)
 
-    subparsers.add_parser('clean', help='Clean build artifacts')
-    subparsers.add_parser('check', help='Check documentation for issues')
+    subparsers.add_parser('clean', help='Clean build artifacts').set_defaults(func=cmd_clean)
+    check_parser = subparsers.add_parser('check', help='Check documentation for issues')
+    check_parser.add_argument('--skip-unchanged', action='store_true',
+                              help='Skip the checks if no docs changed since the last clean check '
+                                   '(external links going dead are not noticed)')
+    check_parser.set_defaults(func=cmd_check)
 
     serve_parser = subparsers.add_parser('serve', help='Serve documentation with live reload')
     serve_parser.add_argument('-p', '--port', type=int, default=8000, help='Port to serve on')
+    serve_parser.set_defaults(func=cmd_serve)
+    subparsers.add_parser('daemon', help='Keep Sphinx loaded and serve build requests').set_defaults(func=cmd_daemon)
+
+    # Parallel Sphinx is memory-hungry - let constrained machines cap the workers
+    for sphinx_parser in (build_parser, check_parser, serve_parser):
+        sphinx_parser.add_argument('-j', '--jobs', type=_jobs_value, default='auto', metavar='N',
+                                   help="Parallel Sphinx processes, or 'auto' for one per core (default: auto)")
+    for sphinx_parser in (build_parser, check_parser):
+        sphinx_parser.add_argument('--subprocess', action='store_true',
+                                   help='Run Sphinx and helper scripts in fresh interpreters instead of in-process')
     return parser
 
 def main() -> int:
-    print(r"""
-╔═════════════════════════════════════════════════════════════════════════════════╗
-║   ██████╗   █████╗   ██████╗    ███████╗  ██████╗  ██████╗   ██████╗  ███████╗  ║
-║   ██╔══██╗ ██╔══██╗ ██╔════╝    ██╔════╝ ██╔═══██╗ ██╔══██╗ ██╔════╝  ██╔════╝  ║
-║   ██║  ██║ ██║  ██║ ██║         █████╗   ██║   ██║ ██████╔╝ ██║  ███╗ ██████║   ║
-║   ██║  ██║ ██║  ██║ ██║         ██╔══╝   ██║   ██║ ██╔══██╗ ██║   ██║ ██║       ║
-║   ██████╔╝ ╚█████╔╝ ╚██████╗    ██║      ╚██████╔╝ ██║  ██║ ╚██████╔╝ ███████╗  ║
-║   ╚═════╝   ╚════╝   ╚═════╝    ╚═╝       ╚═════╝  ╚═╝  ╚═╝  ╚═════╝  ╚══════╝  ║
-╟─────────────────────────────────────────────────────────────────────────────────╢
-║            Eidosian Documentation Command Center                                ║
-╚═════════════════════════════════════════════════════════════════════════════════╝
-""")
+    # The banner is for humans - keep it out of CI logs and piped output
+    if sys.stdout.isatty() and not os.environ.get("DOC_FORGE_NO_BANNER"):
+        out = getattr(sys.stdout, "buffer", None)
+        if out is not None:
+            out.write(_BANNER_BYTES)
+            out.flush()
+        else:
+            sys.stdout.write(BANNER)
 
     parser = create_parser()
     args = parser.parse_args()
@@ -336,19 +1146,12 @@ def main() -> int:
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Debug logging enabled")
 
-    if args.command == 'setup':
-        return cmd_setup(args)
-    elif args.command == 'build':
-        return cmd_build(args)
-    elif args.command == 'clean':
-        return cmd_clean(args)
-    elif args.command == 'check':
-        return cmd_check(args)
-    elif args.command == 'serve':
-        return cmd_serve(args)
-    else:
+    # Each subparser registered its handler as ``func`` - dispatch is one lookup
+    handler = getattr(args, 'func', None)
+    if handler is None:
         parser.print_help()
         return 1
+    return handler(args)
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -22,6 +22,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Any, Union, Optional
 
+from .utils.paths import has_underscore_part
+
 # 📊 Self-aware logging system
 logging.basicConfig(
     level=logging.INFO,
@@ -252,7 +254,7 @@ class DocManifestManager:
         
         for file_path in sorted(md_files + rst_files):
             # Skip files in underscore directories
-            if any(part.startswith("_") for part in file_path.parts):
+            if has_underscore_part(file_path):
                 continue
                 
             # Extract document metadata
@@ -438,24 +440,18 @@ class DocManifestManager:
         Returns:
             List of orphaned documentation paths
         """
-        orphaned_docs: List[str] = []
-        
-        # Build a set of all referenced documents
-        all_references: Set[str] = set()
-        for references in self.doc_references.values():
-            all_references.update(references)
-        
-        # Check for documents that aren't referenced
-        for doc_path in self.doc_sources:
-            # Skip index files and README
-            if doc_path.endswith(("index.md", "index.rst", "README.md")):
-                continue
-                
-            # Check if this document is referenced anywhere
-            if doc_path not in all_references:
-                orphaned_docs.append(doc_path)
-        
-        return orphaned_docs
+        # One set difference finds every unreferenced document
+        all_references: Set[str] = set().union(*self.doc_references.values())
+        unreferenced = self.doc_sources.keys() - all_references
+        if not unreferenced:
+            return []
+        
+        # Keep discovery order; index files and README are never orphans
+        return [
+            doc_path for doc_path in self.doc_sources
+            if doc_path in unreferenced
+            and not doc_path.endswith(("index.md", "index.rst", "README.md"))
+        ]
     
     def update_build_info(self, status: str) -> None:
         """
@@ -528,24 +528,24 @@ if __name__ == "__main__":
         else:
             print(output_data)
     else:
-        print("\n📊 TOC Structure Analysis Results:")
-        print(f"Quality Rating: {results['structure_quality']['quality_rating']}")
-        print(f"Overall Score: {results['structure_quality']['overall_score']:.2f}/100")
-        
-        print("\n📏 Metrics:")
-        for key, value in results["metrics"].items():
-            if key != "section_sizes":
-                print(f"  {key}: {value}")
-        
-        print("\nSection Sizes:")
-        for section, size in results["metrics"]["section_sizes"].items():
-            print(f"  {section}: {size}")
-        
-        print("\n💡 Recommendations:")
+        # Assemble the whole report, then emit it with a single write
+        quality = results["structure_quality"]
+        lines = [
+            "\n📊 TOC Structure Analysis Results:",
+            f"Quality Rating: {quality['quality_rating']}",
+            f"Overall Score: {quality['overall_score']:.2f}/100",
+            "\n📏 Metrics:",
+        ]
+        lines.extend(f"  {key}: {value}" for key, value in results["metrics"].items() if key != "section_sizes")
+        
+        lines.append("\nSection Sizes:")
+        lines.extend(f"  {section}: {size}" for section, size in results["metrics"]["section_sizes"].items())
+        
+        lines.append("\n💡 Recommendations:")
         if results["recommendations"]:
-            for rec in results["recommendations"]:
-                print(f"  • {rec}")
+            lines.extend(f"  • {rec}" for rec in results["recommendations"])
         else:
-            print("  No recommendations - structure looks good!")
+            lines.append("  No recommendations - structure looks good!")
         
-        print(f"\n🎨 Visualization saved to: {results['visualization']}")
\ No newline at end of file
+        lines.append(f"\n🎨 Visualization saved to: {results['visualization']}")
+        sys.stdout.write("\n".join(lines) + "\n")
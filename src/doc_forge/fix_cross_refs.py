@@ -18,13 +18,42 @@ import re
 import sys
 import logging
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 # 📊 Structured Logging - Self-Awareness Foundation
 logging.basicConfig(level=logging.INFO,
                    format="%(asctime)s [%(levelname)8s] %(message)s")
 logger = logging.getLogger("eidosian_docs.cross_ref_fixer")
 
+# List of common exception classes that could be ambiguous
+_EXCEPTION_CLASSES = [
+    'ConnectionError',  # 🔌 Network troubles
+    'ModelNotFoundError',  # 🧩 Missing model
+    'ServerError',  # 🖥️ Server issues
+    'InvalidRequestError',  # 📝 Bad request
+    'TimeoutError',  # ⏱️ Time's up!
+    'OllamaAPIError',  # 🧠 API troubles
+    'APIError',  # 🌐 General API woes
+    'ValueError',  # ❓ Bad values
+    'TypeError',  # 🔢 Wrong types
+]
+_BUILTIN_EXCEPTIONS = {'ValueError', 'TypeError'}  # Python builtins - leave them be
+_EXCEPTIONS_MODULE = "ollama_forge.exceptions"
+
+# Both reference forms in a single alternation - ``lastgroup`` tells them apart.
+# The :raises: colon is only looked at, so it can still open a following :exc: role.
+_QUALIFIABLE = "|".join(name for name in _EXCEPTION_CLASSES if name not in _BUILTIN_EXCEPTIONS)
+_EXCEPTION_REF_RE = re.compile(
+    rf':(?:class|exc):`(?P<ref>{_QUALIFIABLE})`'  # Direct references - catch them in the wild!
+    rf'|:raises\s+(?P<raises>{_QUALIFIABLE})(?=:)'  # :raises: fields - error handling documentation
+)
+
+def _qualify_exception_ref(match: "re.Match[str]") -> str:
+    """Give a matched exception reference its fully qualified home."""
+    if match.lastgroup == "ref":
+        return f":class:`{_EXCEPTIONS_MODULE}.{match.group('ref')}`"
+    return f":raises {_EXCEPTIONS_MODULE}.{match.group('raises')}"
+
 def fix_ambiguous_references(repo_root: Path) -> None:
     """
     Fix ambiguous references in documentation by adding namespace qualifiers.
@@ -45,65 +74,37 @@ def fix_ambiguous_references(repo_root: Path) -> None:
         return
     
     # Step 1: Find all RST files with ambiguous references - hunting for suspects
-    ambiguous_files = []
+    # Keep what we read so the fixing pass never touches the disk a second time
+    content_cache: Dict[Path, str] = {}
     for rst_file in autoapi_dir.glob("**/*.rst"):
-        with open(rst_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = rst_file.read_text(encoding="utf-8")
             
         # Look for "more than one target" warnings in comments or referenced exception classes
         if "more than one target" in content or ":exc:" in content or ":class:" in content and any(err in content for err in ["Error", "Exception"]):
-            ambiguous_files.append(rst_file)
+            content_cache[rst_file] = content
             
-    logger.info(f"🔎 Found {len(ambiguous_files)} files with potential ambiguous references")
+    logger.info(f"🔎 Found {len(content_cache)} files with potential ambiguous references")
     
     # Step 2: Process each file - fix them one by one
-    for rst_file in ambiguous_files:
-        fix_file_references(rst_file)
+    for rst_file, content in content_cache.items():
+        content_cache[rst_file] = fix_file_references(rst_file, content)
         
-def fix_file_references(file_path: Path) -> None:
+def fix_file_references(file_path: Path, content: Optional[str] = None) -> str:
     """
     Fix ambiguous references in a specific file with surgical precision.
     
     Args:
         file_path: Path to the file to fix
+        content: Already-read file content (read from disk if None)
+        
+    Returns:
+        The file content after fixing
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # List of common exception classes that could be ambiguous
-    exception_classes = [
-        'ConnectionError',  # 🔌 Network troubles
-        'ModelNotFoundError',  # 🧩 Missing model
-        'ServerError',  # 🖥️ Server issues
-        'InvalidRequestError',  # 📝 Bad request
-        'TimeoutError',  # ⏱️ Time's up!
-        'OllamaAPIError',  # 🧠 API troubles
-        'APIError',  # 🌐 General API woes
-        'ValueError',  # ❓ Bad values
-        'TypeError',  # 🔢 Wrong types
-    ]
+    if content is None:
+        content = file_path.read_text(encoding="utf-8")
     
-    # Pattern to find references to exception classes without full qualification
-    updated_content = content
-    for exception in exception_classes:
-        # Pattern 1: Direct exception references - catch them in the wild!
-        pattern = rf':(?:class|exc):`({exception})`'
-        # Replace with fully qualified names for exceptions only - give them a proper home
-        if exception not in ['ValueError', 'TypeError']:  # These are Python builtins - leave them be
-            updated_content = re.sub(
-                pattern,
-                r':class:`ollama_forge.exceptions.\1`',
-                updated_content
-            )
-        
-        # Pattern 2: References in :raises: directives - error handling documentation
-        pattern = rf':raises\s+({exception}):'
-        if exception not in ['ValueError', 'TypeError']:
-            updated_content = re.sub(
-                pattern,
-                r':raises ollama_forge.exceptions.\1:',
-                updated_content
-            )
+    # One pass over the content qualifies every class/exc/raises reference at once
+    updated_content = _EXCEPTION_REF_RE.sub(_qualify_exception_ref, content)
     
     # Add :noindex: directive to duplicate references - prevent duplicate object warnings
     pattern = r'(\.\. py:[a-z]+:: [a-zA-Z0-9_.]+\.[a-zA-Z0-9_]+Error)'
@@ -117,9 +118,9 @@ def fix_file_references(file_path: Path) -> None:
     
     # Write the updated content if changed - only make changes when necessary
     if updated_content != content:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(updated_content)
+        file_path.write_text(updated_content, encoding="utf-8")
         logger.info(f"✅ Fixed references in {file_path.name}")
+    return updated_content
 
 def fix_python_imports(repo_root: Path) -> None:
     """
@@ -137,8 +138,7 @@ def fix_python_imports(repo_root: Path) -> None:
     for py_file in source_dir.glob("**/*.py"):
         if py_file.name == "__init__.py":
             # Check for re-exports that cause ambiguity
-            with open(py_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = py_file.read_text(encoding="utf-8")
                 
             # Look for imports of exceptions
             if "from .exceptions import" in content:
@@ -150,8 +150,7 @@ def fix_python_imports(repo_root: Path) -> None:
                 )
                 
                 if updated_content != content:
-                    with open(py_file, "w", encoding="utf-8") as f:
-                        f.write(updated_content)
+                    py_file.write_text(updated_content, encoding="utf-8")
                     logger.info(f"✅ Added noqa to imports in {py_file.name}")
 
 # Add a new function to create a proper intersphinx configuration
@@ -167,8 +166,7 @@ def create_intersphinx_mapping(repo_root: Path) -> None:
         logger.warning(f"conf.py not found at {conf_path}")
         return
         
-    with open(conf_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = conf_path.read_text(encoding="utf-8")
         
     # Check if intersphinx_mapping already exists
     if "intersphinx_mapping" in content and "sphinx.ext.intersphinx" in content:
@@ -204,8 +202,7 @@ intersphinx_mapping = {
             content += "\n" + mapping
             
     # Write updated content
-    with open(conf_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    conf_path.write_text(content, encoding="utf-8")
     logger.info("✅ Added intersphinx configuration to conf.py")
 
 if __name__ == "__main__":
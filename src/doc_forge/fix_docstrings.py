@@ -78,8 +78,7 @@ class DocstringFixer:
         Returns:
             True if file was modified, False otherwise
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = file_path.read_text(encoding="utf-8")
             
         # Apply each fix like a cascading waterfall 🌊
         updated_content = content
@@ -91,8 +90,7 @@ class DocstringFixer:
         
         # Write back if changed - don't fix what isn't broken
         if updated_content != content:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(updated_content)
+            file_path.write_text(updated_content, encoding="utf-8")
             logger.info(f"✨ Fixed formatting issues in {file_path.name}")
             return True
         return False
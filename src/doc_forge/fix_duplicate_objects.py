@@ -17,7 +17,7 @@ import re
 import sys
 import logging
 from pathlib import Path
-from typing import Any, Dict, Counter
+from typing import Any, Dict, Counter, Iterable, Optional
 import time
 
 # 📊 Self-Aware Logging System
@@ -27,6 +27,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger("eidosian_docs.duplicate_harmonizer")
 
+# 🔍 Object description pattern - compiled once, yields (directive, object_name) tuples:
+# - Handles functions with parentheses and arguments
+# - Captures qualified names more accurately
+_OBJECT_PATTERN = re.compile(r'(\.\.\s+(?:py|auto):[a-z]+::\s+([a-zA-Z0-9_\.]+)(?:\([^)]*\))?)')
+
 class DuplicateObjectHarmonizer:
     """
     Identifies and resolves duplicate object descriptions with Eidosian precision.
@@ -43,10 +48,13 @@ class DuplicateObjectHarmonizer:
                      f" with {len(self.seen_objects)} seen objects")
         
         
-    def fix_duplicate_objects(self) -> int:
+    def fix_duplicate_objects(self, files: Optional[Iterable[Path]] = None) -> int:
         """
         Find and fix all duplicate object descriptions with mathematical precision.
         
+        Args:
+            files: Documentation files already listed by a pipeline (globbed if None)
+        
         Returns:
             Number of files fixed - a metric of harmony achieved! 🏆
         """
@@ -58,7 +66,10 @@ class DuplicateObjectHarmonizer:
         start_time = time.time()  # ⏱️ Track performance - velocity is intelligence!
         
         # 🔍 Phase 1: Reconnaissance - map the territory
-        rst_files = list(self.docs_dir.glob("**/*.rst"))
+        if files is None:
+            rst_files = list(self.docs_dir.glob("**/*.rst"))
+        else:
+            rst_files = [f for f in files if f.suffix == ".rst"]
         logger.info(f"🔎 Scanning {len(rst_files)} RST files for duplicate objects")
         
         # First process non-autoapi files to establish canonical sources
@@ -89,25 +100,16 @@ class DuplicateObjectHarmonizer:
     def _process_file(self, rst_file: Path, is_autoapi: bool = False) -> None:
         """Process a single RST file for duplicate objects."""
         try:
-            with open(rst_file, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = rst_file.read_text(encoding="utf-8")
             
             # Extract object descriptions with precision - find:
             # .. py:<type>:: <object_name>
             # Where type can be class, function, method, attribute, etc.
             modified = False
             
-            # Enhanced regex to better capture object descriptions:
-            # - Handles functions with parentheses and arguments
-            # - Captures qualified names more accurately
-            matches = list(re.finditer(r'(\.\.\s+(?:py|auto):[a-z]+::\s+([a-zA-Z0-9_\.]+)(?:\([^)]*\))?)', content))
-            
-            for match in matches:
-                full_match = match.group(1)
-                object_name = match.group(2)
-                
+            for full_match, object_name in _OBJECT_PATTERN.findall(content):
                 # Skip if it already has :noindex:
-                noindex_pattern = f"{full_match}\\s+:noindex:"
+                noindex_pattern = f"{re.escape(full_match)}\\s+:noindex:"
                 if re.search(noindex_pattern, content):
                     continue
                 
@@ -128,8 +130,7 @@ class DuplicateObjectHarmonizer:
             
             # 📝 Phase 2: Strategic intervention - save changes with precision
             if modified:
-                with open(rst_file, "w", encoding="utf-8") as f:
-                    f.write(content)
+                rst_file.write_text(content, encoding="utf-8")
                 self.fixed_count += 1
                 logger.debug(f"📄 Fixed file: {rst_file}")
                 
@@ -12,11 +12,13 @@ import os
 import re
 import sys
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any, Pattern
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any, Pattern
 
 # Import project-wide utilities
-from .utils.paths import get_repo_root, get_docs_dir, resolve_path
+from .utils.paths import get_repo_root, get_docs_dir, resolve_path, list_doc_files
 
 # 📊 Self-aware logging system
 logging.basicConfig(
@@ -25,6 +27,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger("doc_forge.fix_inline_refs")
 
+# Reference patterns compiled once at import, shared by every fixer instance
+_REFERENCE_PATTERNS: Dict[str, Pattern[str]] = {
+    "markdown_links": re.compile(r'\[([^\]]+)\]\(([^)]+)\)'),
+    "markdown_refs": re.compile(r'\[([^\]]+)\]\[([^\]]+)\]'),
+    "rst_refs": re.compile(r':(?:doc|ref):`([^`]+)`'),
+    "html_links": re.compile(r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>')
+}
+
 class InlineReferenceFixer:
     """Fixes inline references in documentation with Eidosian precision."""
     
@@ -38,27 +48,26 @@ class InlineReferenceFixer:
         self.docs_dir = docs_dir
         self.files_fixed = 0
         self.refs_fixed = 0
+        # Files are fixed on a thread pool; the shared tallies need a guard
+        self._count_lock = threading.Lock()
         
         # Patterns for different types of references
-        self.patterns = {
-            "markdown_links": re.compile(r'\[([^\]]+)\]\(([^)]+)\)'),
-            "markdown_refs": re.compile(r'\[([^\]]+)\]\[([^\]]+)\]'),
-            "rst_refs": re.compile(r':(?:doc|ref):`([^`]+)`'),
-            "html_links": re.compile(r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>')
-        }
+        self.patterns = _REFERENCE_PATTERNS
         
-    def fix_all_files(self) -> int:
+    def fix_all_files(self, files: Optional[Iterable[Path]] = None) -> int:
         """
         Fix inline references in all documentation files.
         
+        Args:
+            files: Pre-collected documentation files (walks the docs tree if None)
+            
         Returns:
             Number of files fixed
         """
         logger.info(f"🔍 Scanning for documentation files in {self.docs_dir}")
         
         # Find all markdown and RST files
-        md_files = list(self.docs_dir.glob("**/*.md"))
-        rst_files = list(self.docs_dir.glob("**/*.rst"))
+        md_files, rst_files = self._find_doc_files(files)
         all_files = md_files + rst_files
         
         logger.info(f"📚 Found {len(all_files)} documentation files ({len(md_files)} MD, {len(rst_files)} RST)")
@@ -66,13 +75,39 @@ class InlineReferenceFixer:
         # Create a mapping of document paths
         path_mapping = self._create_path_mapping(all_files)
         
-        # Process each file
-        for file_path in all_files:
-            self._fix_file_references(file_path, path_mapping)
+        # Files are independent - overlap their reads, regex passes and writes
+        workers = min(32, (os.cpu_count() or 1) * 4, len(all_files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(lambda path: self._fix_file_references(path, path_mapping), all_files))
+        else:
+            for file_path in all_files:
+                self._fix_file_references(file_path, path_mapping)
             
         logger.info(f"✅ Fixed {self.refs_fixed} references in {self.files_fixed} files")
         return self.files_fixed
     
+    def _find_doc_files(self, files: Optional[Iterable[Path]] = None) -> Tuple[List[Path], List[Path]]:
+        """
+        Split documentation sources into Markdown and RST.
+        
+        Args:
+            files: Pre-collected files; one pruned walk of the docs tree if None
+        
+        Returns:
+            Tuple of (markdown files, RST files)
+        """
+        if files is None:
+            files = list_doc_files(self.docs_dir)
+        md_files: List[Path] = []
+        rst_files: List[Path] = []
+        for file_path in files:
+            if file_path.suffix == ".md":
+                md_files.append(file_path)
+            elif file_path.suffix == ".rst":
+                rst_files.append(file_path)
+        return md_files, rst_files
+    
     def _create_path_mapping(self, all_files: List[Path]) -> Dict[str, Path]:
         """
         Create a mapping of document references to actual paths.
@@ -98,14 +133,12 @@ class InlineReferenceFixer:
             stem_path = rel_path.with_suffix("")
             mapping[str(stem_path)] = file_path
             
-            # 3. Path with HTML extension (common in output references)
-            html_path = rel_path.with_suffix(".html")
-            mapping[str(html_path)] = file_path
+            # (HTML output references are normalized at lookup, not stored)
             
-            # 4. Filename only (for simple references)
+            # 3. Filename only (for simple references)
             mapping[file_path.stem] = file_path
             
-            # 5. Title-based reference (filename with underscores replaced by spaces)
+            # 4. Title-based reference (filename with underscores replaced by spaces)
             title_ref = file_path.stem.replace("_", " ")
             mapping[title_ref] = file_path
             
@@ -145,7 +178,8 @@ class InlineReferenceFixer:
                 with open(file_path, "w", encoding="utf-8") as f:
                     f.write(content)
                     
-                self.files_fixed += 1
+                with self._count_lock:
+                    self.files_fixed += 1
                 logger.debug(f"🔧 Fixed references in {file_path.relative_to(self.docs_dir)}")
                 return True
                 
@@ -170,9 +204,11 @@ class InlineReferenceFixer:
         # Track original content for comparison
         original_content = content
         file_dir = file_path.parent
+        fixed = 0
         
         # Fix markdown links [text](link)
         def fix_md_link(match: re.Match) -> str:
+            nonlocal fixed
             text = match.group(1)
             link = match.group(2)
             
@@ -191,12 +227,15 @@ class InlineReferenceFixer:
                 if rel_path.endswith((".rst", ".html")):
                     rel_path = rel_path[:-len(rel_path.split(".")[-1])-1] + ".md"
                     
-                self.refs_fixed += 1
+                fixed += 1
                 return f"[{text}]({rel_path})"
             
             return match.group(0)
             
         content = self.patterns["markdown_links"].sub(fix_md_link, content)
+        if fixed:
+            with self._count_lock:
+                self.refs_fixed += fixed
         
         # Fix markdown reference links [text][ref]
         # These are more complex and would need a second pass to fix the reference definitions
@@ -218,9 +257,11 @@ class InlineReferenceFixer:
         # Track original content for comparison
         original_content = content
         file_dir = file_path.parent
+        fixed = 0
         
         # Fix RST doc references :doc:`link`
         def fix_rst_doc_ref(match: re.Match) -> str:
+            nonlocal fixed
             link = match.group(1)
             
             # Extract the link text if present
@@ -237,7 +278,7 @@ class InlineReferenceFixer:
                 rel_path = link_path.relative_to(self.docs_dir)
                 rel_path = str(rel_path.with_suffix("")).replace("\\", "/")
                 
-                self.refs_fixed += 1
+                fixed += 1
                 if link_text:
                     return f":doc:`{link_text} <{rel_path}>`"
                 else:
@@ -246,6 +287,9 @@ class InlineReferenceFixer:
             return match.group(0)
             
         content = self.patterns["rst_refs"].sub(fix_rst_doc_ref, content)
+        if fixed:
+            with self._count_lock:
+                self.refs_fixed += fixed
         
         return content
     
@@ -268,8 +312,15 @@ class InlineReferenceFixer:
         if link in path_mapping:
             return path_mapping[link]
         
+        # HTML output references resolve through the source-path keys; RST
+        # files are mapped after Markdown, so they win a shared stem
+        if link.endswith(".html"):
+            for ext in (".rst", ".md"):
+                if link[:-5] + ext in path_mapping:
+                    return path_mapping[link[:-5] + ext]
+        
         # Try with various extensions
-        for ext in ["", ".md", ".rst", ".html"]:
+        for ext in (".md", ".rst"):
             if link + ext in path_mapping:
                 return path_mapping[link + ext]
         
@@ -296,7 +347,7 @@ class InlineReferenceFixer:
         
         return None
 
-def fix_inline_references(docs_dir: Optional[Path] = None) -> int:
+def fix_inline_references(docs_dir: Optional[Path] = None, files: Optional[Iterable[Path]] = None) -> int:
     """
     Fix inline references in all documentation files.
     
@@ -305,6 +356,7 @@ def fix_inline_references(docs_dir: Optional[Path] = None) -> int:
     
     Args:
         docs_dir: Documentation directory (auto-detected if None)
+        files: Documentation files already listed by the caller (walked if None)
         
     Returns:
         Number of files fixed (negative if there was an error)
@@ -328,7 +380,7 @@ def fix_inline_references(docs_dir: Optional[Path] = None) -> int:
     try:
         # Create fixer and run
         fixer = InlineReferenceFixer(docs_dir)
-        files_fixed = fixer.fix_all_files()
+        files_fixed = fixer.fix_all_files(files)
         
         logger.info(f"✅ Reference fixing complete. Fixed {files_fixed} files")
         return files_fixed
@@ -19,7 +19,7 @@ import re
 import sys
 import logging
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Counter
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Counter
 from functools import lru_cache
 
 # 📊 Self-aware logging - know thyself!
@@ -55,6 +55,8 @@ class RstSyntaxPerfector:
         """
         Fix inline interpreted text syntax issues in RST files.
         
+        Files are visited in priority order (exceptions, then autoapi, then api).
+        
         Args:
             target_path: Optional specific file to fix, otherwise scans docs_dir
             
@@ -65,26 +67,25 @@ class RstSyntaxPerfector:
         
         # Determine what to process - specific target or full directory scan
         if target_path and target_path.exists():
-            files_to_process = [target_path]
+            files_to_process: Iterator[Path] = iter([target_path])
         else:
-            # Default: Focus on autoapi and exceptions documentation
-            exceptions_paths = list(self.docs_dir.glob("**/exceptions/**/*.rst"))
-            autoapi_paths = list(self.docs_dir.glob("**/autoapi/**/*.rst"))
-            api_paths = list(self.docs_dir.glob("**/api/**/*.rst"))
-            files_to_process = exceptions_paths + autoapi_paths + api_paths
-            
-            if not files_to_process:
-                logger.warning(f"⚠️ No RST files found to process in {self.docs_dir}")
-                return 0
+            # Default: Focus on exceptions first, then the wider API documentation
+            files_to_process = self._iter_priority_files()
         
         # Process each file - surgical precision for each document
+        seen_any = False
         for rst_file in files_to_process:
+            seen_any = True
             try:
                 if self._fix_file(rst_file):
                     self.fixed_count += 1
             except Exception as e:
                 logger.error(f"❌ Error processing {rst_file}: {e}")
         
+        if not seen_any:
+            logger.warning(f"⚠️ No RST files found to process in {self.docs_dir}")
+            return 0
+        
         # Report results - celebrate victories!
         if self.fixed_count > 0:
             logger.info(f"✅ Fixed RST syntax issues in {self.fixed_count} files")
@@ -96,6 +97,15 @@ class RstSyntaxPerfector:
             
         return self.fixed_count
     
+    def _iter_priority_files(self) -> Iterator[Path]:
+        """Yield RST files highest-priority tier first, each file at most once."""
+        seen: Set[Path] = set()
+        for pattern in ("**/exceptions/**/*.rst", "**/autoapi/**/*.rst", "**/api/**/*.rst"):
+            for rst_file in self.docs_dir.glob(pattern):
+                if rst_file not in seen:
+                    seen.add(rst_file)
+                    yield rst_file
+    
     @lru_cache(maxsize=32)  # 🚀 Cache regex results for velocity
     def _get_syntax_pattern(self, pattern_name: str):
         """Get cached regex pattern for performance."""
@@ -14,9 +14,11 @@ Following Eidosian principles of:
 """
 
 import os
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, Mapping, Optional, Any
 
 # Import version information for consistency
 from .version import VERSION, get_version_string
@@ -122,7 +124,57 @@ def get_project_info() -> Dict[str, str]:
     """
     return PROJECT
 
-def get_doc_structure(repo_root: Optional[Path] = None) -> Dict[str, Path]:
+def _structure_table() -> Dict[str, str]:
+    """Relative location (under the docs root) of every structure key, as plain strings."""
+    table: Dict[str, str] = {"root": ""}
+    
+    # Add all subdirectories
+    for key, subdir in DOC_STRUCTURE.items():
+        if key != "root":
+            table[key] = subdir
+    
+    # Add all category subdirectories, and the sections within each category
+    for category, sections in DOC_CATEGORIES.items():
+        category_dir = DOC_STRUCTURE.get(category, category)
+        table[category] = category_dir
+        for section in sections:
+            table[f"{category}_{section}"] = f"{category_dir}/{section}"
+    
+    return table
+
+_STRUCTURE_TABLE = _structure_table()
+
+class _LazyPaths(Mapping[str, Path]):
+    """
+    Read-only structure mapping that builds each ``Path`` on first access.
+    
+    Most runs touch one or two keys, so the dozens of category/section paths
+    are only materialized (and then cached) when someone actually asks.
+    """
+    
+    def __init__(self, docs_dir: Path, table: Dict[str, str]):
+        self._root = docs_dir
+        self._table = table
+        self._cache: Dict[str, Path] = {}
+    
+    def __getitem__(self, key: str) -> Path:
+        path = self._cache.get(key)
+        if path is None:
+            relative = self._table[key]
+            path = self._root / relative if relative else self._root
+            self._cache[key] = path
+        return path
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table)
+    
+    def __len__(self) -> int:
+        return len(self._table)
+    
+    def __repr__(self) -> str:
+        return f"_LazyPaths({self._root!r}, keys={list(self._table)})"
+
+def get_doc_structure(repo_root: Optional[Path] = None) -> Mapping[str, Path]:
     """
     Get documentation directory structure with absolute paths.
     
@@ -130,33 +182,14 @@ def get_doc_structure(repo_root: Optional[Path] = None) -> Dict[str, Path]:
         repo_root: Repository root path (auto-detected if None)
         
     Returns:
-        Dictionary mapping structure keys to absolute paths
+        Read-only mapping of structure keys to absolute paths, built lazily on
+        access - wrap it in ``dict(...)`` if you need to modify it
     """
     if repo_root is None:
         from .utils.paths import get_repo_root
         repo_root = get_repo_root()
     
-    result: Dict[str, Path] = {}
-    
-    # Add the root docs directory
-    docs_dir = repo_root / DOC_STRUCTURE["root"]
-    result["root"] = docs_dir
-    
-    # Add all subdirectories
-    for key, subdir in DOC_STRUCTURE.items():
-        if key != "root":
-            result[key] = docs_dir / subdir
-    
-    # Add all category subdirectories
-    for category, sections in DOC_CATEGORIES.items():
-        category_dir = docs_dir / DOC_STRUCTURE.get(category, category)
-        result[category] = category_dir
-        
-        # Add sections within each category
-        for section in sections:
-            result[f"{category}_{section}"] = category_dir / section
-    
-    return result
+    return _LazyPaths(repo_root / DOC_STRUCTURE["root"], _STRUCTURE_TABLE)
 
 def get_config() -> Dict[str, Any]:
     """
@@ -165,27 +198,29 @@ def get_config() -> Dict[str, Any]:
     Returns:
         Dictionary with configuration
     """
-    config = DEFAULT_CONFIG.copy()
+    # Fresh lists per call - a caller extending one must not alter the defaults
+    config = {key: list(value) if isinstance(value, list) else value
+              for key, value in DEFAULT_CONFIG.items()}
     
     # Override with environment variables
     for key, value in config.items():
-        env_key = f"DOC_FORGE_{key.upper()}"
-        if env_key in os.environ:
-            env_value = os.environ[env_key]
-            
-            # Convert to appropriate type
-            if isinstance(value, list):
-                config[key] = env_value.split(",")
-            elif isinstance(value, bool):
-                config[key] = env_value.lower() in ("true", "1", "yes", "y")
-            elif isinstance(value, int):
-                config[key] = int(env_value)
-            else:
-                config[key] = env_value
+        env_value = os.environ.get(f"DOC_FORGE_{key.upper()}")
+        if env_value is None:
+            continue
+        
+        # Convert to appropriate type
+        if isinstance(value, list):
+            config[key] = env_value.split(",")
+        elif isinstance(value, bool):
+            config[key] = env_value.lower() in ("true", "1", "yes", "y")
+        elif isinstance(value, int):
+            config[key] = int(env_value)
+        else:
+            config[key] = env_value
     
     return config
 
-def ensure_doc_structure(repo_root: Optional[Path] = None) -> Dict[str, Path]:
+def ensure_doc_structure(repo_root: Optional[Path] = None) -> Mapping[str, Path]:
     """
     Ensure all documentation directories exist with Eidosian perfection.
     
@@ -193,39 +228,42 @@ def ensure_doc_structure(repo_root: Optional[Path] = None) -> Dict[str, Path]:
         repo_root: Repository root path (auto-detected if None)
         
     Returns:
-        Dictionary mapping structure keys to absolute paths
+        Read-only mapping of structure keys to absolute paths (see
+        ``get_doc_structure``)
     """
     structure = get_doc_structure(repo_root)
     
-    # Create all directories
-    for path in structure.values():
-        path.mkdir(parents=True, exist_ok=True)
+    # Ancestors come for free with their deepest descendants, so only the
+    # leaves need a mkdir - and those independent syscalls run side by side
+    paths = set(structure.values())
+    ancestors = {parent for path in paths for parent in path.parents}
+    leaves = [path for path in paths if path not in ancestors]
+    with ThreadPoolExecutor(max_workers=min(8, len(leaves) or 1)) as pool:
+        list(pool.map(lambda path: path.mkdir(parents=True, exist_ok=True), leaves))
     
     return structure
 
-# Initialize global paths dictionary on module load
-_global_paths: Dict[str, Any] = {}
 GLOBAL_PATHS_OVERRIDE: Dict[str, Any] = {}
 
-def get_paths() -> Dict[str, Path]:
+@functools.lru_cache(maxsize=None)
+def _repo_paths() -> Mapping[str, Path]:
+    """Resolve the repository's structure once; a failure raises and is not cached."""
+    from .utils.paths import get_repo_root
+    return get_doc_structure(get_repo_root())
+
+def get_paths() -> Mapping[str, Path]:
     """
     Get global paths with Eidosian precision.
     
     Returns:
-        Dictionary mapping path keys to absolute paths
+        Read-only mapping of path keys to absolute paths, shared across calls -
+        copy it with ``dict(...)`` before modifying; empty if resolution fails
     """
-    global _global_paths
-    
-    if not _global_paths:
-        try:
-            from .utils.paths import get_repo_root
-            repo_root = get_repo_root()
-            _global_paths = get_doc_structure(repo_root)
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize global paths: {e}")
-            _global_paths = {}
-    
-    return _global_paths
+    try:
+        return _repo_paths()
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize global paths: {e}")
+        return {}
 
 def get_global_config() -> Dict[str, Any]:
     """
@@ -4,34 +4,52 @@ from __future__ import annotations
 import sys
 import logging
 import argparse
-
-from .doc_forge import create_parser as create_doc_forge_parser
-from .doc_forge import main as doc_forge_main
-# Fixed import by using relative import and proper path structure
-# Importing from package root is problematic during development
-try:
-    # First try relative import (when installed as package)
-    from ..tests.test_command import add_test_subparsers
-except (ImportError, ValueError):
-    # Fall back to absolute import (when running from source)
-     from tests.test_command import add_test_subparsers # type: ignore[import]
+from typing import Any, List, Optional
 
 from .version import get_version_string
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)8s] %(message)s (%(filename)s:%(lineno)s)"
-)
 logger = logging.getLogger("doc_forge")
 
+def _doc_forge_main() -> int:
+    """Import and run the docs command handler only when a docs command runs."""
+    from .doc_forge import main as doc_forge_main
+    return doc_forge_main()
+
+def _add_test_subparsers(test_subparsers: Any) -> None:
+    """Import the test command wiring only when a test command is requested."""
+    # Fixed import by using relative import and proper path structure
+    # Importing from package root is problematic during development
+    try:
+        # First try relative import (when installed as package)
+        from ..tests.test_command import add_test_subparsers
+    except (ImportError, ValueError):
+        # Fall back to absolute import (when running from source)
+        from tests.test_command import add_test_subparsers # type: ignore[import]
+    add_test_subparsers(test_subparsers)
+
 def main() -> int:
     """
     Orchestrates argument parsing, sets debug flags, shows version info if requested,
     and routes commands to their handlers. Returns an integer exit code for the CLI.
     """
-    parser: argparse.ArgumentParser = create_main_parser()
+    argv: List[str] = sys.argv[1:]
+
+    # Fast exit: a top-level --version needs neither the parser nor logging
+    for arg in argv:
+        if arg in ("--version", "-V"):
+            print(f"Doc Forge v{get_version_string()}")
+            return 0
+        if not arg.startswith("-"):
+            break  # A command domain begins - its options are not ours
+
+    parser: argparse.ArgumentParser = create_main_parser(argv)
     args: argparse.Namespace = parser.parse_args()
 
+    # Logging is configured after parsing so --help and --version stay instant
+    logging.basicConfig(
+        level=logging.DEBUG if getattr(args, "debug", False) else logging.INFO,
+        format="%(asctime)s [%(levelname)8s] %(message)s (%(filename)s:%(lineno)s)"
+    )
     if getattr(args, "debug", False):
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Debug mode activated.")
@@ -42,7 +60,7 @@ def main() -> int:
 
     cmd_type: str | None = getattr(args, "command_type", None)
     if cmd_type == "docs":
-        return doc_forge_main()
+        return _doc_forge_main()
     if cmd_type == "test":
         func = getattr(args, "func", None)
         if func:
@@ -51,7 +69,7 @@ def main() -> int:
         return 0
 
     try:
-        return doc_forge_main()
+        return _doc_forge_main()
     except Exception as e:
         logger.error(f"Command failed: {e}")
         if logging.getLogger().level <= logging.DEBUG:
@@ -59,10 +77,13 @@ def main() -> int:
             logger.debug(traceback.format_exc())
         return 1
 
-def create_main_parser() -> argparse.ArgumentParser:
+def create_main_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
     """
     Creates the main parser with subcommands for documentation and testing.
     Returns a fully configured argparse.ArgumentParser instance.
+    
+    Test subcommands pull in the test tooling, so they are only registered
+    when ``argv`` asks for the test domain (or when no argv is given).
     """
     parser = argparse.ArgumentParser(
         description=(
@@ -79,12 +100,12 @@ def create_main_parser() -> argparse.ArgumentParser:
 
     docs_parser = subparsers.add_parser("docs", help="Documentation commands")
     docs_parser.add_subparsers(dest="command", help="Docs subcommand")
-    create_doc_forge_parser()
 
     test_parser = subparsers.add_parser("test", help="Testing commands")
     # Type annotation and proper handling for test subcommands
     test_subparsers = test_parser.add_subparsers(dest="command", help="Test subcommand")
-    add_test_subparsers(test_subparsers)
+    if argv is None or "test" in argv:
+        _add_test_subparsers(test_subparsers)
 
     return parser
 
@@ -6,10 +6,12 @@ Source Discovery - Finding Documentation Sources with Eidosian Precision
 
 import os
 import re
+import sys
+import mmap
 import logging
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Set, Optional, Any, Union, TypeVar, cast, Tuple
+from typing import Dict, Iterator, List, Set, Optional, Any, Union, TypeVar, cast, Tuple
 
 from .global_info import get_doc_structure
 from .utils.paths import get_repo_root, get_docs_dir
@@ -29,14 +31,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger("doc_forge.source_discovery")
 
+# Reference patterns compiled once; findall hands back the captured strings directly
+_RST_DOC_REF_RE = re.compile(r':doc:`(.*?)`')
+_RST_HYPERLINK_RE = re.compile(r'`[^`]*?<(.*?)>`_')
+_MD_TITLE_RE = re.compile(r'^#\s+(.*?)$', re.MULTILINE)
+_MD_LINK_RE = re.compile(r'\[.*?\]\((.*?)\)')
+_LINK_ANCHOR_RE = re.compile(r'#.*$')
+_LINK_DOC_SUFFIX_RE = re.compile(r'\.(md|rst)$')
+_RST_UNDERLINE_CHARS = frozenset("=-")
+_INCLUDE_RES = (
+    re.compile(r'\.\. include:: (.*?)$', re.MULTILINE),
+    re.compile(r'\{\% include "(.*?)" \%\}', re.MULTILINE),
+    re.compile(r'\{\{ *include\("(.*?)"\) *\}\}', re.MULTILINE),
+)
+# Bytes twins for large RST files scanned straight out of the page cache
+_MMAP_THRESHOLD = 8 * 1024  # Smaller files are cheaper to just read
+_RST_DOC_REF_RE_B = re.compile(_RST_DOC_REF_RE.pattern.encode())
+_RST_HYPERLINK_RE_B = re.compile(_RST_HYPERLINK_RE.pattern.encode())
+_RST_UNDERLINE_LINE_RE_B = re.compile(rb'^[=\-]+$', re.MULTILINE)
+_INCLUDE_RES_B = tuple(re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+                       for pattern in _INCLUDE_RES)
+_SOURCE_SUFFIX_RE = re.compile(r'\.(md|rst|txt)$')
+_CLASS_DEF_RE = re.compile(r'class\s+([A-Za-z0-9_]+)(?:\(.*?\))?:')
+_FUNC_DEF_RE = re.compile(r'def\s+([A-Za-z0-9_]+)(?:\(.*?\))?:')
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+
+def _is_rst_underline(line: str) -> bool:
+    """True for a non-empty line made only of ``=``/``-`` - a set check, no regex engine."""
+    return bool(line) and _RST_UNDERLINE_CHARS.issuperset(line)
+
+def _iter_doc_files(root: Path, extensions: Tuple[str, ...]) -> Iterator[Path]:
+    """
+    Yield documentation files below ``root`` from a single ``os.scandir`` walk.
+
+    Names starting with ``_`` are skipped before descending, so ``_build``,
+    ``_static`` and friends are pruned whole rather than filtered per file;
+    ``DirEntry`` type checks come from the directory listing, not extra stats.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith("_"):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(extensions) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+
 class DocumentMetadata:
+    # One instance per discovered file - slots drop the per-instance __dict__
+    __slots__ = ("path", "title", "category", "section", "priority", "url", "references", "is_index")
+
     def __init__(self, path: Path, title: str = "", category: str = "", section: str = "", priority: int = 50):
         self.path = path
         self.title = title or path.stem.replace("_", " ").title()
         self.category = category
         self.section = section
         self.priority = priority
-        self.url = str(path.with_suffix(".html")).replace("\\", "/")
+        # Interned - URLs are compared across tracked/known/referenced sets
+        self.url = sys.intern(str(path.with_suffix(".html")).replace("\\", "/"))
         self.references: Set[str] = set()
         self.is_index = path.stem.lower() == "index"
         self._extract_metadata()
@@ -45,6 +102,8 @@ class DocumentMetadata:
         if not self.path.exists():
             return
         try:
+            if self.path.suffix == ".rst" and self._extract_mapped_rst_metadata():
+                return
             with open(self.path, "r", encoding="utf-8") as f:
                 content = f.read()
             if self.path.suffix == ".md":
@@ -56,15 +115,18 @@ class DocumentMetadata:
             logger.warning(f"⚠️ Error extracting metadata from {self.path}: {e}")
 
     def _extract_markdown_metadata(self, content: str) -> None:
-        title_match = re.search(r'^#\s+(.*?)$', content, re.MULTILINE)
+        title_match = _MD_TITLE_RE.search(content)
         if title_match:
             self.title = title_match.group(1).strip()
-        md_links = re.finditer(r'\[.*?\]\((.*?)\)', content)
+        # Substring probes skip the regex scans for files with nothing to find
+        if "](" not in content:
+            return
+        md_links = _MD_LINK_RE.finditer(content)
         for match in md_links:
             link = match.group(1).strip()
             if not link.startswith(("http:", "https:", "#", "mailto:")):
-                clean_link = re.sub(r'#.*$', '', link)
-                clean_link = re.sub(r'\.(md|rst)$', '', clean_link)
+                clean_link = _LINK_ANCHOR_RE.sub('', link)
+                clean_link = _LINK_DOC_SUFFIX_RE.sub('', clean_link)
                 self.references.add(clean_link)
 
     def _extract_rst_metadata(self, content: str) -> None:
@@ -72,28 +134,65 @@ class DocumentMetadata:
         for i, line in enumerate(lines):
             if i > 0 and i < len(lines) - 1:
                 next_line = lines[i + 1]
-                if re.match(r'^[=\-]+$', next_line) and len(line) > 0:
+                if _is_rst_underline(next_line) and len(line) > 0:
                     if len(line.strip()) == len(next_line.strip()):
                         self.title = line.strip()
                         break
-        rst_links = re.finditer(r':doc:`(.*?)`', content)
-        for match in rst_links:
-            link = match.group(1).strip()
-            self.references.add(link)
-        rst_hyperlinks = re.finditer(r'`[^`]*?<(.*?)>`_', content)
-        for match in rst_hyperlinks:
-            link = match.group(1).strip()
-            if not link.startswith(("http:", "https:", "#", "mailto:")):
-                self.references.add(link)
+        if ":doc:`" in content:
+            for link in _RST_DOC_REF_RE.findall(content):
+                self.references.add(link.strip())
+        if ">`_" in content:
+            for link in _RST_HYPERLINK_RE.findall(content):
+                link = link.strip()
+                if not link.startswith(("http:", "https:", "#", "mailto:")):
+                    self.references.add(link)
+
+    def _extract_mapped_rst_metadata(self) -> bool:
+        """
+        Scan a large RST file through a read-only ``mmap`` with bytes patterns,
+        decoding only the matched fragments rather than the whole file.
+
+        Returns:
+            False when the file is small or has ``\\r`` line endings (text mode
+            would translate those), leaving the caller to take the ``str`` path
+        """
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\r") != -1:
+                    return False
+                # Same rule as the line loop: an underline matching its title's
+                # length, where the title is not the file's first line
+                for underline in _RST_UNDERLINE_LINE_RE_B.finditer(mm):
+                    line_end = underline.start() - 1
+                    if line_end < 0:
+                        continue
+                    line_start = mm.rfind(b"\n", 0, line_end) + 1
+                    if line_start == 0 or line_end == line_start:
+                        continue
+                    line = mm[line_start:line_end].decode("utf-8").strip()
+                    if len(line) == len(underline.group().decode("utf-8").strip()):
+                        self.title = line
+                        break
+                for link in _RST_DOC_REF_RE_B.findall(mm):
+                    self.references.add(link.decode("utf-8").strip())
+                for link in _RST_HYPERLINK_RE_B.findall(mm):
+                    link = link.decode("utf-8").strip()
+                    if not link.startswith(("http:", "https:", "#", "mailto:")):
+                        self.references.add(link)
+                for pattern in _INCLUDE_RES_B:
+                    for match in pattern.finditer(mm):
+                        include_path = match.group(1).decode("utf-8").strip()
+                        if not include_path.startswith(("http:", "https:", "#")):
+                            self.references.add(include_path)
+        return True
 
     def _extract_common_references(self, content: str) -> None:
-        include_patterns = [
-            r'\.\. include:: (.*?)$',
-            r'\{\% include "(.*?)" \%\}',
-            r'\{\{ *include\("(.*?)"\) *\}\}',
-        ]
-        for pattern in include_patterns:
-            for match in re.finditer(pattern, content, re.MULTILINE):
+        if "include" not in content:
+            return
+        for pattern in _INCLUDE_RES:
+            for match in pattern.finditer(content):
                 include_path = match.group(1).strip()
                 if not include_path.startswith(("http:", "https:", "#")):
                     self.references.add(include_path)
@@ -109,7 +208,7 @@ class DocumentationDiscovery:
         self.documents: Dict[str, List[DocumentMetadata]] = defaultdict(list)
         self.orphaned_documents: List[Path] = []
         self.tracked_documents: Set[str] = set()
-        self.doc_extensions = [".md", ".rst", ".txt"]
+        self.doc_extensions = (".md", ".rst", ".txt")
         self._file_content_cache: Dict[str, str] = {}
 
     def discover_all(self) -> Dict[str, List[DocumentMetadata]]:
@@ -137,17 +236,14 @@ class DocumentationDiscovery:
                 section_dir = user_docs_dir / section
                 if not section_dir.is_dir():
                     continue
-                for ext in self.doc_extensions:
-                    for file_path in section_dir.glob(f"**/*{ext}"):
-                        if any(p.startswith("_") for p in file_path.parts):
-                            continue
-                        doc = DocumentMetadata(
-                            path=file_path,
-                            category="user",
-                            section=section,
-                            priority=self._calculate_doc_priority(file_path, section, "user")
-                        )
-                        self.documents["user"].append(doc)
+                for file_path in _iter_doc_files(section_dir, self.doc_extensions):
+                    doc = DocumentMetadata(
+                        path=file_path,
+                        category="user",
+                        section=section,
+                        priority=self._calculate_doc_priority(file_path, section, "user")
+                    )
+                    self.documents["user"].append(doc)
         except Exception as e:
             logger.error(f"🔥 Error discovering user documentation: {e}")
         logger.info(f"📚 Discovered {len(self.documents['user'])} user documentation files")
@@ -167,21 +263,18 @@ class DocumentationDiscovery:
             if not section_dir.exists():
                 continue
             section = section_dir.name
-            for ext in self.doc_extensions:
-                try:
-                    for file_path in section_dir.glob(f"**/*{ext}"):
-                        if any(p.startswith("_") for p in file_path.parts):
-                            continue
-                        doc = DocumentMetadata(
-                            path=file_path,
-                            category="auto",
-                            section=section,
-                            priority=self._calculate_doc_priority(file_path, section, "auto")
-                        )
-                        self.documents["auto"].append(doc)
-                        discovered_count += 1
-                except Exception as e:
-                    logger.warning(f"⚠️ Error processing auto docs in {section_dir}: {e}")
+            try:
+                for file_path in _iter_doc_files(section_dir, self.doc_extensions):
+                    doc = DocumentMetadata(
+                        path=file_path,
+                        category="auto",
+                        section=section,
+                        priority=self._calculate_doc_priority(file_path, section, "auto")
+                    )
+                    self.documents["auto"].append(doc)
+                    discovered_count += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Error processing auto docs in {section_dir}: {e}")
         logger.info(f"🤖 Discovered {discovered_count} auto-generated documentation files")
 
     def _discover_ai_docs(self) -> None:
@@ -194,17 +287,14 @@ class DocumentationDiscovery:
                 section_dir = ai_docs_dir / section
                 if not section_dir.is_dir():
                     continue
-                for ext in self.doc_extensions:
-                    for file_path in section_dir.glob(f"**/*{ext}"):
-                        if any(p.startswith("_") for p in file_path.parts):
-                            continue
-                        doc = DocumentMetadata(
-                            path=file_path,
-                            category="ai",
-                            section=section,
-                            priority=self._calculate_doc_priority(file_path, section, "ai")
-                        )
-                        self.documents["ai"].append(doc)
+                for file_path in _iter_doc_files(section_dir, self.doc_extensions):
+                    doc = DocumentMetadata(
+                        path=file_path,
+                        category="ai",
+                        section=section,
+                        priority=self._calculate_doc_priority(file_path, section, "ai")
+                    )
+                    self.documents["ai"].append(doc)
         except Exception as e:
             logger.error(f"🔥 Error discovering AI documentation: {e}")
         logger.info(f"🧠 Discovered {len(self.documents['ai'])} AI-generated documentation files")
@@ -222,51 +312,34 @@ class DocumentationDiscovery:
         return max(0, min(100, base_priority))
 
     def _identify_orphans(self) -> None:
-        all_docs: List[Path] = []
-        for ext in self.doc_extensions:
-            all_docs.extend(list(self.docs_dir.glob(f"**/*{ext}")))
-            all_docs.extend(self.docs_dir.glob(f"**/*{ext}"))
-        structure_dirs = {
+        all_docs = list(_iter_doc_files(self.docs_dir, self.doc_extensions))
+        # Prefix tuples let one C-level str.startswith replace the per-directory loops
+        structure_prefixes = tuple({
             str(path) for path in self.doc_structure.values()
             if hasattr(path, "exists") and path.exists()
-        }
-        ignored_dirs = [
-            self.docs_dir / "_build",
-            self.docs_dir / "_static",
-            self.docs_dir / "_templates",
-            self.docs_dir / "venv",
-            self.docs_dir / ".venv",
-        ]
+        })
+        ignored_prefixes = tuple(
+            str(self.docs_dir / name) for name in ("_build", "_static", "_templates", "venv", ".venv")
+        )
+        tracked = self.tracked_documents
         for file_path in all_docs:
-            if any(p.startswith("_") for p in file_path.parts):
-                continue
-            if any(str(file_path).startswith(str(ignored)) for ignored in ignored_dirs):
+            path_str = str(file_path)
+            if path_str.startswith(ignored_prefixes) or path_str.startswith(structure_prefixes):
                 continue
-            in_structure = False
-            for dir_path in structure_dirs:
-                if str(file_path).startswith(dir_path):
-                    in_structure = True
-                    break
-            already_tracked = False
-            doc_url = str(file_path.with_suffix(".html")).replace("\\", "/")
-            if doc_url in self.tracked_documents:
-                already_tracked = True
-            if not in_structure and not already_tracked:
+            doc_url = sys.intern(str(file_path.with_suffix(".html")).replace("\\", "/"))
+            if doc_url not in tracked:
                 self.orphaned_documents.append(file_path)
         logger.info(f"🏝️ Found {len(self.orphaned_documents)} orphaned documentation files")
 
     def _resolve_document_relations(self) -> None:
-        doc_map: Dict[str, DocumentMetadata] = {}
-        for _, docs in self.documents.items():
-            for d in docs:
-                doc_map[d.url] = d
-        for _, docs_list in self.documents.items():
-            for doc in docs_list:
-                for ref in doc.references:
-                    ref_url = f"{ref}.html"
-                    if ref_url in doc_map:
-                        pass
-        logger.debug("📊 Document relations resolved with Eidosian precision")
+        known_urls = {d.url for docs in self.documents.values() for d in docs}
+        referenced_urls = {
+            sys.intern(f"{ref}.html") for docs in self.documents.values() for doc in docs for ref in doc.references
+        }
+        # One set difference instead of a dict probe per reference
+        unresolved = referenced_urls - known_urls
+        logger.debug(f"📊 Document relations resolved with Eidosian precision "
+                     f"({len(referenced_urls) - len(unresolved)} linked, {len(unresolved)} unresolved)")
 
     def generate_toc_structure(self) -> Dict[str, TocSection]:
         toc: Dict[str, TocSection] = {
@@ -331,7 +404,7 @@ class DocumentationDiscovery:
             if not orphan.is_file() or not orphan.exists():
                 continue
             orphan_url = str(orphan.relative_to(self.docs_dir)).replace('\\', '/')
-            orphan_url = re.sub(r'\.(md|rst|txt)$', '.html', orphan_url)
+            orphan_url = sys.intern(_SOURCE_SUFFIX_RE.sub('.html', orphan_url))
             if orphan_url in self.tracked_documents:
                 continue
             best_section, title = self._analyze_orphan_content(orphan, section_patterns)
@@ -393,7 +466,7 @@ class DocumentationDiscovery:
                 for i, line in enumerate(content_lines):
                     if i > 0 and i < len(content_lines) - 1:
                         next_line = content_lines[i + 1]
-                        if (re.match(r'^[=\-]+$', next_line)
+                        if (_is_rst_underline(next_line)
                                 and line.strip()
                                 and len(line.strip()) >= len(next_line.strip()) * 0.8):
                             title = line.strip()
@@ -411,11 +484,7 @@ class DocumentationDiscovery:
         }
         user_docs_dir = self.doc_structure.get("user_docs", self.docs_dir / "user_docs")
         if user_docs_dir.exists():
-            for ext in self.doc_extensions:
-                all_sources["user"].extend(
-                    p for p in user_docs_dir.glob(f"**/*{ext}")
-                    if not any(part.startswith("_") for part in p.parts)
-                )
+            all_sources["user"].extend(_iter_doc_files(user_docs_dir, self.doc_extensions))
         auto_docs_dir = self.doc_structure.get("auto_docs", self.docs_dir / "auto_docs")
         autoapi_dirs = [
             auto_docs_dir,
@@ -425,18 +494,10 @@ class DocumentationDiscovery:
         ]
         for directory in autoapi_dirs:
             if directory.exists():
-                for ext in self.doc_extensions:
-                    all_sources["auto"].extend(
-                        p for p in directory.glob(f"**/*{ext}")
-                        if not any(part.startswith("_") for part in p.parts)
-                    )
+                all_sources["auto"].extend(_iter_doc_files(directory, self.doc_extensions))
         ai_docs_dir = self.doc_structure.get("ai_docs", self.docs_dir / "ai_docs")
         if ai_docs_dir.exists():
-            for ext in self.doc_extensions:
-                all_sources["ai"].extend(
-                    p for p in ai_docs_dir.glob(f"**/*{ext}")
-                    if not any(part.startswith("_") for part in p.parts)
-                )
+            all_sources["ai"].extend(_iter_doc_files(ai_docs_dir, self.doc_extensions))
         all_sources["orphaned"] = self.orphaned_documents
         return all_sources
 
@@ -486,11 +547,11 @@ def discover_code_structures(src_dir: Optional[Path] = None) -> List[Dict[str, A
                 "file": str(file_path),
                 "doc_ready": True
             })
-            class_matches = re.finditer(r'class\s+([A-Za-z0-9_]+)(?:\(.*?\))?:', content)
+            class_matches = _CLASS_DEF_RE.finditer(content)
             for match in class_matches:
                 class_name = match.group(1)
                 class_pos = match.start()
-                docstring_match = re.search(r'"""(.*?)"""', content[class_pos:class_pos+500], re.DOTALL)
+                docstring_match = _DOCSTRING_RE.search(content, class_pos, class_pos + 500)
                 has_docs = bool(docstring_match)
                 discovered_items.append({
                     "name": class_name,
@@ -499,13 +560,13 @@ def discover_code_structures(src_dir: Optional[Path] = None) -> List[Dict[str, A
                     "module": module_name,
                     "doc_ready": has_docs
                 })
-            func_matches = re.finditer(r'def\s+([A-Za-z0-9_]+)(?:\(.*?\))?:', content)
+            func_matches = _FUNC_DEF_RE.finditer(content)
             for match in func_matches:
                 func_name = match.group(1)
                 if func_name.startswith("_") and not (func_name.startswith("__") and func_name.endswith("__")):
                     continue
                 func_pos = match.start()
-                docstring_match = re.search(r'"""(.*?)"""', content[func_pos:func_pos+500], re.DOTALL)
+                docstring_match = _DOCSTRING_RE.search(content, func_pos, func_pos + 500)
                 has_docs = bool(docstring_match)
                 discovered_items.append({
                     "name": func_name,
@@ -33,6 +33,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("doc_forge.toctrees")
 
+# Compiled once - every index file update runs both
+_MD_TOCTREE_RE = re.compile(r'```{toctree}.*?```', re.DOTALL)
+_MD_HEADING_RE = re.compile(r'^#\s+.*?$', re.MULTILINE)
+# Index page generated for a directory that lacks one
+_DIR_INDEX_TEMPLATE = "# {title}\n\n```{{toctree}}\n:maxdepth: 1\n:caption: {title}\n\n{entries}```\n"
+
+def _find_toctree(content: str) -> Optional["re.Match[str]"]:
+    """Locate an existing toctree block - a substring probe rejects most files before any regex runs."""
+    if "```{toctree}" not in content:
+        return None
+    return _MD_TOCTREE_RE.search(content)
+
 class TocTreeManager:
     """
     Table of Contents Tree Manager with perfect Eidosian structure awareness.
@@ -89,7 +101,7 @@ class TocTreeManager:
             content = f.read()
             
         # Check if there's already a TOC
-        toc_match = re.search(r'```{toctree}.*?```', content, re.DOTALL)
+        toc_match = _find_toctree(content)
         
         # Create new TOC content
         toc_content = self._generate_main_toc()
@@ -99,7 +111,7 @@ class TocTreeManager:
             new_content = content[:toc_match.start()] + toc_content + content[toc_match.end():]
         else:
             # Add TOC after the first heading
-            heading_match = re.search(r'^#\s+.*?$', content, re.MULTILINE)
+            heading_match = _MD_HEADING_RE.search(content)
             if heading_match:
                 insert_pos = heading_match.end()
                 new_content = content[:insert_pos] + "\n\n" + toc_content + "\n\n" + content[insert_pos:].lstrip()
@@ -169,7 +181,7 @@ class TocTreeManager:
                 content = f.read()
                 
             # Check if there's already a TOC
-            toc_match = re.search(r'```{toctree}.*?```', content, re.DOTALL)
+            toc_match = _find_toctree(content)
             
             # Create new TOC content
             toc_content = self._generate_section_toc(section_data)
@@ -179,7 +191,7 @@ class TocTreeManager:
                 new_content = content[:toc_match.start()] + toc_content + content[toc_match.end():]
             else:
                 # Add TOC after the first heading
-                heading_match = re.search(r'^#\s+.*?$', content, re.MULTILINE)
+                heading_match = _MD_HEADING_RE.search(content)
                 if heading_match:
                     insert_pos = heading_match.end()
                     new_content = content[:insert_pos] + "\n\n" + toc_content + "\n\n" + content[insert_pos:].lstrip()
@@ -254,24 +266,14 @@ class TocTreeManager:
                 if index_md.exists() or index_rst.exists():
                     continue
                     
-                # Create a new index file
-                dir_name = dir_path.name.replace("_", " ").title()
-                content = f"# {dir_name}\n\n"
-                
-                # Add all documents in this directory to the TOC
-                content += "```{toctree}\n"
-                content += ":maxdepth: 1\n"
-                content += f":caption: {dir_name}\n\n"
-                
-                for doc in dir_doc_list:
-                    # Skip if this is an index file
-                    if doc.path.stem.lower() == "index":
-                        continue
-                        
-                    # Add to TOC
-                    content += f"{doc.path.stem}\n"
-                
-                content += "```\n"
+                # Create a new index file listing every non-index document here
+                content = _DIR_INDEX_TEMPLATE.format(
+                    title=dir_path.name.replace("_", " ").title(),
+                    entries="".join(
+                        f"{doc.path.stem}\n" for doc in dir_doc_list
+                        if doc.path.stem.lower() != "index"
+                    ),
+                )
                 
                 # Write the index file
                 with open(index_md, "w", encoding="utf-8") as f:
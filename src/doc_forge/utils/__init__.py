@@ -5,6 +5,7 @@ This package provides universal utilities for Doc Forge,
 following Eidosian principles of precision, structure, and flow.
 """
 
-from .paths import get_repo_root, get_docs_dir, resolve_path, ensure_dir, ensure_scripts_dir
+from .paths import get_repo_root, get_docs_dir, resolve_path, ensure_dir, ensure_scripts_dir, has_underscore_part, list_doc_files
 
-__all__ = ['get_repo_root', 'get_docs_dir', 'resolve_path', 'ensure_dir', 'ensure_scripts_dir']
+__all__ = ['get_repo_root', 'get_docs_dir', 'resolve_path', 'ensure_dir', 'ensure_scripts_dir',
+           'has_underscore_part', 'list_doc_files']
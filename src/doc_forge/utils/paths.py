@@ -11,16 +11,17 @@ path handling across the entire system.
 import os
 import sys
 import logging
+import functools
 from pathlib import Path
-from typing import Union, Optional, List
+from typing import Union, Optional, List, Tuple
 
 # Self-aware logging
 logger = logging.getLogger("doc_forge.paths")
 
-# Global cache for performance
-_REPO_ROOT: Optional[Path] = None
-_DOCS_DIR: Optional[Path] = None
+# Separator followed by underscore - marks a private/generated path component
+_UNDERSCORE_PARTS = tuple(sep + "_" for sep in (os.sep, os.altsep) if sep)
 
+@functools.lru_cache(maxsize=None)  # Detected once per process - the stat probes never repeat
 def get_repo_root() -> Path:
     """
     Get the repository root directory with unwavering precision.
@@ -28,11 +29,6 @@ def get_repo_root() -> Path:
     Returns:
         Path to repository root
     """
-    global _REPO_ROOT
-    
-    if _REPO_ROOT is not None:
-        return _REPO_ROOT
-    
     # Starting points for search
     start_points = [
         Path.cwd(),                         # Current directory
@@ -52,32 +48,34 @@ def get_repo_root() -> Path:
             
     # Search for repo indicators from each starting point
     for directory in unique_starts:
-        # Check if this is repo root by looking for key indicators
-        is_repo_root = any((
-            (directory / "docs").is_dir() and (directory / "src" / "doc_forge").is_dir(),
-            (directory / ".git").is_dir() and (directory / "src").is_dir(),
-            (directory / "setup.py").is_file() and (directory / "docs").is_dir()
-        ))
+        # Check if this is repo root by looking for key indicators - plain
+        # os.path probes on strings, short-circuiting at the first hit
+        base = os.fspath(directory)
+        has_docs = os.path.isdir(os.path.join(base, "docs"))
+        is_repo_root = (
+            (has_docs and os.path.isdir(os.path.join(base, "src", "doc_forge")))
+            or (os.path.isdir(os.path.join(base, ".git")) and os.path.isdir(os.path.join(base, "src")))
+            or (has_docs and os.path.isfile(os.path.join(base, "setup.py")))
+        )
         
         if is_repo_root:
-            _REPO_ROOT = directory
-            logger.debug(f"Found repo root at {_REPO_ROOT}")
-            return _REPO_ROOT
+            logger.debug(f"Found repo root at {directory}")
+            return directory
     
     # Fallback: If we're in src/doc_forge, go up two levels
     current = Path(__file__).resolve().parent
     if "src/doc_forge" in str(current) or "src\\doc_forge" in str(current):
         candidate = current.parent.parent.parent
         if (candidate / "docs").is_dir():
-            _REPO_ROOT = candidate
-            logger.debug(f"Found repo root via module path: {_REPO_ROOT}")
-            return _REPO_ROOT
+            logger.debug(f"Found repo root via module path: {candidate}")
+            return candidate
     
     # Last resort: use current directory and warn
-    _REPO_ROOT = Path.cwd()
-    logger.warning(f"⚠️ Could not determine repo root, using current directory: {_REPO_ROOT}")
-    return _REPO_ROOT
+    repo_root = Path.cwd()
+    logger.warning(f"⚠️ Could not determine repo root, using current directory: {repo_root}")
+    return repo_root
 
+@functools.lru_cache(maxsize=None)
 def get_docs_dir() -> Path:
     """
     Get the documentation directory with perfect precision.
@@ -85,37 +83,23 @@ def get_docs_dir() -> Path:
     Returns:
         Path to documentation directory
     """
-    global _DOCS_DIR
-    
-    if _DOCS_DIR is not None:
-        return _DOCS_DIR
-    
     # First, get the repo root
     repo_root = get_repo_root()
     
-    # Check the canonical location first
-    docs_dir = repo_root / "docs"
-    if docs_dir.is_dir():
-        _DOCS_DIR = docs_dir
-        return _DOCS_DIR
-        
-    # Check fallback locations
-    candidates = [
-        repo_root / "documentation",
-        repo_root / "doc"
-    ]
-    
-    for candidate in candidates:
-        if candidate.is_dir():
-            _DOCS_DIR = candidate
-            logger.warning(f"⚠️ Using non-standard docs directory: {_DOCS_DIR}")
-            return _DOCS_DIR
+    # Canonical location first, then the fallbacks - only the hit becomes a Path
+    root = os.fspath(repo_root)
+    for name in ("docs", "documentation", "doc"):
+        if os.path.isdir(os.path.join(root, name)):
+            candidate = repo_root / name
+            if name != "docs":
+                logger.warning(f"⚠️ Using non-standard docs directory: {candidate}")
+            return candidate
     
     # Create it if it doesn't exist
+    docs_dir = repo_root / "docs"
     docs_dir.mkdir(parents=True, exist_ok=True)
-    _DOCS_DIR = docs_dir
-    logger.warning(f"⚠️ Created missing documentation directory: {_DOCS_DIR}")
-    return _DOCS_DIR
+    logger.warning(f"⚠️ Created missing documentation directory: {docs_dir}")
+    return docs_dir
 
 def resolve_path(path: Union[str, Path], relative_to: Optional[Path] = None) -> Path:
     """
@@ -141,6 +125,42 @@ def resolve_path(path: Union[str, Path], relative_to: Optional[Path] = None) ->
     # Otherwise, make relative to repo root
     return (get_repo_root() / path_obj).resolve()
 
+def has_underscore_part(path: Union[str, Path]) -> bool:
+    """
+    Check whether any component of a path starts with ``_`` (``_build``, ``_static``...).
+
+    A substring scan of the path string - no ``Path.parts`` tuple is built.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if some component begins with an underscore
+    """
+    path_str = os.fspath(path)
+    return path_str.startswith("_") or any(marker in path_str for marker in _UNDERSCORE_PARTS)
+
+def list_doc_files(root: Path, extensions: Tuple[str, ...] = (".md", ".rst")) -> List[Path]:
+    """
+    List documentation sources below a root in one walk.
+    
+    Underscore directories (``_build``, ``_static``, ...) hold generated output
+    and assets, so they are pruned before descent. The listing can be shared by
+    several pipeline stages instead of each re-walking the tree.
+    
+    Args:
+        root: Directory to walk
+        extensions: File suffixes to keep
+        
+    Returns:
+        Matching file paths in walk order
+    """
+    files: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith("_")]
+        files.extend(Path(dirpath, name) for name in filenames if name.endswith(extensions))
+    return files
+
 def ensure_dir(path: Union[str, Path]) -> Path:
     """
     Ensure a directory exists with perfect precision.
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# 🌀 Test module for the AutoAPI fixer with Eidosian precision
+"""
+Tests for ``AutoAPIFixer``'s fast paths and the cross-references it writes.
+
+The raw-bytes path and the worker pool are optimizations only - each must
+leave every file exactly as the plain sequential, decoded pipeline would.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+import doc_forge.autoapi_fixer as autoapi_fixer
+from doc_forge.autoapi_fixer import AutoAPIFixer
+
+# One file per transform, plus files that must take the decoded path
+SAMPLES: Dict[str, bytes] = {
+    "plain.rst": b"Title\n=====\n\nNothing to fix here.\n",
+    "errors.rst": b".. py:exception:: FooError\n\n   Raised on foo.\n\n"
+                  b"See :exc:`pkg.errors.FooError` for details.\n",
+    "refs.rst": b"Raises FooError when :class:`FooError` is seen.\n\n:raises FooError: always\n",
+    "duplicates.rst": b".. py:function:: run()\n\n.. py:function:: run()\n",
+    "literal.rst": b"Use `foo to start.\n",
+    "indent.rst": b"Text\n  indented\n        deeper\n",
+    "example.rst": b"Example:\nrun()\n",
+    "unicode.rst": "Café `menu\n".encode("utf-8"),
+    "crlf.rst": b"Title\r\n=====\r\n\r\nSee `foo\r\n",
+}
+
+
+def make_tree(root: Path, copies: int = 1) -> Path:
+    """Write the samples (``copies`` times over) into an AutoAPI tree below ``root``."""
+    autoapi = root / "docs" / "autoapi"
+    for n in range(copies):
+        package = autoapi / f"pkg{n}"
+        package.mkdir(parents=True)
+        for name, raw in SAMPLES.items():
+            (package / name).write_bytes(raw)
+    return root / "docs"
+
+
+def snapshot(docs: Path) -> Dict[str, bytes]:
+    return {str(p.relative_to(docs)): p.read_bytes() for p in sorted(docs.rglob("*.rst"))}
+
+
+def fix_decoded(docs: Path) -> int:
+    """The reference pipeline: every file read as text, one at a time."""
+    fixer = AutoAPIFixer(docs)
+    fixer.discover_exceptions()
+    return sum(fixer.fix_file(path) for path in fixer._get_rst_files())
+
+
+class TestRawFastPath:
+    """Plain files may skip decoding, but never with a different result."""
+
+    def test_matches_the_decoded_pipeline(self, tmp_path: Path) -> None:
+        fast = make_tree(tmp_path / "fast")
+        reference = make_tree(tmp_path / "reference")
+        pristine = snapshot(fast)
+
+        fixed = AutoAPIFixer(fast).fix_all_files(max_workers=1)
+        assert fixed == fix_decoded(reference)
+        assert snapshot(fast) == snapshot(reference)
+        assert fixed and snapshot(fast) != pristine
+
+    def test_discovery_keeps_only_plain_files_as_bytes(self, tmp_path: Path) -> None:
+        docs = make_tree(tmp_path)
+        contents = AutoAPIFixer(docs).discover_exceptions()
+        kinds = {path.name: type(content) for path, content in contents.items()}
+        assert kinds["plain.rst"] is bytes
+        assert kinds["unicode.rst"] is str
+        assert kinds["crlf.rst"] is str
+
+    def test_untouched_file_is_never_decoded(self, tmp_path: Path,
+                                             monkeypatch: pytest.MonkeyPatch) -> None:
+        docs = make_tree(tmp_path)
+        fixer = AutoAPIFixer(docs)
+        contents = fixer.discover_exceptions()
+        plain = next(path for path in contents if path.name == "plain.rst")
+
+        def must_not_run(content: str) -> str:
+            raise AssertionError("decoded pipeline ran on a plain no-op file")
+
+        monkeypatch.setattr(fixer, "fix_cross_references", must_not_run)
+        assert fixer.fix_file(plain, contents[plain]) is False
+        assert plain.read_bytes() == SAMPLES["plain.rst"]
+
+    @pytest.mark.parametrize("name", sorted(SAMPLES))
+    def test_unchanged_probe_is_sound(self, tmp_path: Path, name: str) -> None:
+        docs = make_tree(tmp_path)
+        fixer = AutoAPIFixer(docs)
+        fixer.discover_exceptions()
+        raw = SAMPLES[name]
+        if autoapi_fixer._NEEDS_TEXT_RE.search(raw) or not fixer._is_unchanged_raw(raw):
+            return
+        assert fixer.fix_file(next(docs.rglob(name))) is False
+
+
+class TestWorkerPool:
+    """Large trees are fixed across processes with the same outcome as in-process."""
+
+    def test_pool_matches_sequential(self, tmp_path: Path) -> None:
+        copies = autoapi_fixer._PARALLEL_THRESHOLD // len(SAMPLES) + 1
+        pooled = make_tree(tmp_path / "pooled", copies)
+        sequential = make_tree(tmp_path / "sequential", copies)
+
+        assert AutoAPIFixer(pooled).fix_all_files(max_workers=2) == \
+            AutoAPIFixer(sequential).fix_all_files(max_workers=1)
+        assert snapshot(pooled) == snapshot(sequential)
+
+    def test_unavailable_pool_falls_back(self, tmp_path: Path,
+                                         monkeypatch: pytest.MonkeyPatch) -> None:
+        copies = autoapi_fixer._PARALLEL_THRESHOLD // len(SAMPLES) + 1
+        docs = make_tree(tmp_path / "docs", copies)
+        reference = make_tree(tmp_path / "reference", copies)
+
+        def no_processes(*args: object, **kwargs: object) -> None:
+            raise OSError("no semaphores here")
+
+        monkeypatch.setattr(autoapi_fixer, "ProcessPoolExecutor", no_processes)
+        assert AutoAPIFixer(docs).fix_all_files(max_workers=2) == fix_decoded(reference)
+        assert snapshot(docs) == snapshot(reference)
+
+
+def qualifier(*names: str, prefix: str = "pkg.errors.") -> AutoAPIFixer:
+    """A fixer that already knows ``names`` and the run's module prefix."""
+    fixer = AutoAPIFixer(Path("docs"))
+    fixer.exceptions_list.update(names)
+    fixer._module_prefix = prefix
+    return fixer
+
+
+class TestCrossReferences:
+    """Every mention of a known exception is qualified, wherever it sits in the file."""
+
+    def test_adjacent_names_are_all_qualified(self) -> None:
+        fixer = qualifier("FooError")
+        assert fixer.fix_cross_references("FooError FooError") == \
+            "pkg.errors.FooError pkg.errors.FooError"
+        assert fixer.fix_cross_references("(FooError,FooError)") == \
+            "(pkg.errors.FooError,pkg.errors.FooError)"
+
+    def test_names_at_the_file_edges_are_qualified(self) -> None:
+        fixer = qualifier("FooError")
+        assert fixer.fix_cross_references("FooError is raised") == "pkg.errors.FooError is raised"
+        assert fixer.fix_cross_references("raises FooError") == "raises pkg.errors.FooError"
+        assert fixer.fix_cross_references("FooError") == "pkg.errors.FooError"
+
+    def test_longest_name_wins(self) -> None:
+        fixer = qualifier("FooError", "AppFooError")
+        assert fixer.fix_cross_references(":class:`AppFooError` and :exc:`FooError`") == \
+            ":class:`pkg.errors.AppFooError` and :class:`pkg.errors.FooError`"
+
+    def test_qualified_and_dotted_names_are_left_alone(self) -> None:
+        fixer = qualifier("FooError")
+        text = "other.FooError and FooErrorish"
+        assert fixer.fix_cross_references(text) == text
+
+    @pytest.mark.parametrize("bare", ["a_first.rst", "z_last.rst"])
+    def test_run_wide_prefix_replaces_the_placeholder(self, tmp_path: Path, bare: str) -> None:
+        autoapi = tmp_path / "docs" / "autoapi"
+        autoapi.mkdir(parents=True)
+        (autoapi / "m_errors.rst").write_text(
+            ".. py:exception:: FooError\n\nSee :exc:`pkg.errors.FooError`.\n"
+        )
+        (autoapi / bare).write_text("Raises FooError on failure.\n")
+
+        AutoAPIFixer(tmp_path / "docs").fix_all_files(max_workers=1)
+        fixed = (autoapi / bare).read_text()
+        assert "pkg.errors.FooError" in fixed
+        assert "my_project.exceptions" not in fixed
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+# 🌀 Test module for the doc_forge command center with Eidosian precision
+"""
+Tests for the ``doc_forge`` CLI commands.
+
+Sphinx itself is replaced by small fakes, so these tests exercise the
+command logic (caching, skipping, cleanup) rather than the documentation build.
+"""
+
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+import pytest
+
+import doc_forge.doc_forge as forge
+
+
+@pytest.fixture
+def docs_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the command center at a throwaway docs tree."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "index.rst").write_text("Index\n=====\n")
+    (docs / "conf.py").write_text("project = 'test'\n")
+    build = docs / "_build"
+    monkeypatch.setattr(forge, "DOCS_DIR", docs)
+    monkeypatch.setattr(forge, "_DOCS_DIR_S", str(docs))
+    monkeypatch.setattr(forge, "BUILD_DIR", build)
+    monkeypatch.setattr(forge, "DOCTREES_DIR", build / "doctrees")
+    monkeypatch.setattr(forge, "TEST_DOCTREES_DIR", build / "doctrees-test")
+    monkeypatch.setattr(forge, "CHECK_DIGEST_FILE", build / ".check_digest")
+    monkeypatch.setattr(forge, "OUTPUT_CACHE_DIR", build / ".cache")
+    monkeypatch.setattr(forge, "_sphinx_doctrees", lambda doctrees=None: [])
+    return docs
+
+
+class FakeSphinx:
+    """Stands in for ``_sphinx``: records every invocation and writes plausible output."""
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+        self.linkcheck: Tuple[int, str, str] = (0, "", "")
+        self.test: Tuple[int, str, str] = (0, "", "")
+        self.page = "first"
+
+    def __call__(self, sphinx_args: List[str], args: argparse.Namespace,
+                 capture: bool = True) -> Tuple[int, str, str]:
+        self.calls.append(sphinx_args)
+        if "linkcheck" in sphinx_args:
+            outdir = Path(sphinx_args[-1])
+            outdir.mkdir(parents=True, exist_ok=True)
+            (outdir / "output.json").write_text("{}")
+            return self.linkcheck
+        if "-W" in sphinx_args:
+            return self.test
+        outdir = Path(sphinx_args[-1])
+        outdir.mkdir(parents=True, exist_ok=True)
+        (outdir / "index.html").write_text(self.page)
+        return 0, "", ""
+
+
+class TestCheckDigest:
+    """``check`` may only be skipped on request, and only after a fully clean run."""
+
+    @pytest.fixture
+    def sphinx(self, docs_tree: Path, monkeypatch: pytest.MonkeyPatch) -> FakeSphinx:
+        fake = FakeSphinx()
+        monkeypatch.setattr(forge, "_sphinx", fake)
+        monkeypatch.setattr(forge, "_run", lambda *a, **k: (0, "", ""))
+        return fake
+
+    @staticmethod
+    def check(skip_unchanged: bool = False) -> int:
+        return forge.cmd_check(argparse.Namespace(skip_unchanged=skip_unchanged, subprocess=True))
+
+    def test_clean_check_is_skipped_only_when_asked(self, sphinx: FakeSphinx) -> None:
+        assert self.check() == 0
+        assert forge.CHECK_DIGEST_FILE.is_file()
+        ran = len(sphinx.calls)
+
+        assert self.check(skip_unchanged=True) == 0
+        assert len(sphinx.calls) == ran
+
+        assert self.check() == 0
+        assert len(sphinx.calls) == 2 * ran
+
+    def test_broken_links_are_never_recorded(self, sphinx: FakeSphinx) -> None:
+        assert self.check() == 0
+        sphinx.linkcheck = (1, "", "build finished; broken links found")
+        self.check()
+        assert not forge.CHECK_DIGEST_FILE.exists()
+
+        ran = len(sphinx.calls)
+        self.check(skip_unchanged=True)
+        assert len(sphinx.calls) > ran
+
+    def test_source_change_runs_the_checks_again(self, docs_tree: Path, sphinx: FakeSphinx) -> None:
+        assert self.check() == 0
+        ran = len(sphinx.calls)
+        (docs_tree / "index.rst").write_text("Index\n=====\n\nChanged.\n")
+        assert self.check(skip_unchanged=True) == 0
+        assert len(sphinx.calls) > ran
+
+
+class TestDaemon:
+    """Builds round-trip through a running daemon, which rereads changed package sources."""
+
+    @pytest.fixture
+    def daemon_paths(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        run = tmp_path / "run"
+        run.mkdir()
+        monkeypatch.setattr(forge, "BUILD_DIR", run)
+        monkeypatch.setattr(forge, "DAEMON_PID_FILE", run / "pid")
+        monkeypatch.setattr(forge, "DAEMON_SOCKET", run / "sock")
+        return run
+
+    @pytest.fixture
+    def daemon(self, daemon_paths: Path, tmp_path: Path,
+               monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+        """Serve ``cmd_daemon`` on a thread over a fake Sphinx; yields the package source dir."""
+        sources = tmp_path / "repo" / "src"
+        sources.mkdir(parents=True)
+        (sources / "forge_daemon_probe.py").write_text("VALUE = 1\n")
+        monkeypatch.setattr(forge, "REPO_ROOT", tmp_path / "repo")
+        monkeypatch.syspath_prepend(str(sources))
+
+        def build_main(sphinx_args: List[str]) -> int:
+            if sphinx_args == ["stop"]:
+                raise KeyboardInterrupt
+            import forge_daemon_probe
+            print(f"built {' '.join(sphinx_args)} with {forge_daemon_probe.VALUE}")
+            print("a warning", file=sys.stderr)
+            return 3
+
+        for name in ("sphinx", "sphinx.cmd", "sphinx.cmd.build"):
+            monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+        monkeypatch.setattr(sys.modules["sphinx.cmd.build"], "build_main", build_main, raising=False)
+        monkeypatch.delitem(sys.modules, "forge_daemon_probe", raising=False)
+
+        server = threading.Thread(target=forge.cmd_daemon, args=(argparse.Namespace(),), daemon=True)
+        server.start()
+        deadline = time.time() + 5
+        while not forge.DAEMON_PID_FILE.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        yield sources
+        forge._daemon_build(["stop"])
+        server.join(5)
+        assert not forge.DAEMON_PID_FILE.exists()
+
+    def test_reply_round_trips(self, daemon: Path, capsys: pytest.CaptureFixture) -> None:
+        code, out, err = forge._daemon_build(["-b", "html"])
+        assert (code, out, err) == (3, "built -b html with 1\n", "a warning\n")
+        assert "built -b html" in capsys.readouterr().out
+
+    def test_changed_sources_are_reimported(self, daemon: Path) -> None:
+        assert forge._daemon_build(["first"])[1] == "built first with 1\n"
+        (daemon / "forge_daemon_probe.py").write_text("VALUE = 22\n")
+        assert forge._daemon_build(["second"])[1] == "built second with 22\n"
+
+    def test_wedged_daemon_falls_back(self, daemon_paths: Path,
+                                      monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(forge, "DAEMON_TIMEOUT", 0.2)
+        forge.DAEMON_PID_FILE.write_text(str(os.getpid()))
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wedged:
+            wedged.bind(str(forge.DAEMON_SOCKET))
+            wedged.listen()  # Accepts connections, never answers
+            started = time.time()
+            assert forge._daemon_build(["-b", "html"]) is None
+            assert time.time() - started < 5
+
+    def test_forget_modules_drops_only_that_tree(self, tmp_path: Path,
+                                                 monkeypatch: pytest.MonkeyPatch) -> None:
+        inside = types.ModuleType("inside")
+        inside.__file__ = str(tmp_path / "src" / "inside.py")
+        sibling = types.ModuleType("sibling")
+        sibling.__file__ = str(tmp_path / "src-other" / "sibling.py")
+        monkeypatch.setitem(sys.modules, "inside", inside)
+        monkeypatch.setitem(sys.modules, "sibling", sibling)
+
+        assert forge._forget_modules(tmp_path / "src") == 1
+        assert "inside" not in sys.modules
+        assert "sibling" in sys.modules
+
+
+class TestCheckDoctrees:
+    """The -W build must read documents itself, or their warnings never surface."""
+
+    @pytest.fixture
+    def sphinx(self, docs_tree: Path, monkeypatch: pytest.MonkeyPatch) -> FakeSphinx:
+        fake = FakeSphinx()
+        monkeypatch.setattr(forge, "_sphinx", fake)
+        monkeypatch.setattr(forge, "_run", lambda *a, **k: (0, "", ""))
+        monkeypatch.setattr(forge, "_sphinx_doctrees",
+                            lambda doctrees=None: ["-d", str(doctrees or forge.DOCTREES_DIR)])
+        return fake
+
+    @staticmethod
+    def doctrees_of(sphinx: FakeSphinx, flag: str) -> str:
+        call = next(call for call in sphinx.calls if flag in call)
+        return call[call.index("-d") + 1]
+
+    @pytest.mark.parametrize("subprocess", [True, False])
+    def test_warning_build_has_its_own_doctrees(self, sphinx: FakeSphinx, subprocess: bool) -> None:
+        forge.cmd_check(argparse.Namespace(skip_unchanged=False, subprocess=subprocess))
+        assert self.doctrees_of(sphinx, "linkcheck") == str(forge.DOCTREES_DIR)
+        assert self.doctrees_of(sphinx, "-W") == str(forge.TEST_DOCTREES_DIR)
+
+    def test_failed_warning_build_rereads_everything(self, sphinx: FakeSphinx) -> None:
+        forge.TEST_DOCTREES_DIR.mkdir(parents=True)
+        (forge.TEST_DOCTREES_DIR / "environment.pickle").write_text("")
+        sphinx.test = (1, "", "index.rst:3: WARNING: Unknown directive type")
+
+        assert forge.cmd_check(argparse.Namespace(skip_unchanged=False, subprocess=True)) == 1
+        assert not forge.TEST_DOCTREES_DIR.exists()
+
+
+class TestOutputCache:
+    """On request, builds are skipped when up to date or restored from the latest copy."""
+
+    @pytest.fixture
+    def sphinx(self, docs_tree: Path, monkeypatch: pytest.MonkeyPatch) -> FakeSphinx:
+        fake = FakeSphinx()
+        monkeypatch.setattr(forge, "_sphinx", fake)
+        return fake
+
+    @pytest.fixture
+    def build(self, sphinx: FakeSphinx, monkeypatch: pytest.MonkeyPatch) -> Callable[..., int]:
+        def build(key: str, output_cache: bool = True, skip_unchanged: bool = True) -> int:
+            monkeypatch.setattr(forge, "_source_key", lambda roots=None: key)
+            args = argparse.Namespace(formats=["html"], output_cache=output_cache,
+                                      skip_unchanged=skip_unchanged, subprocess=True)
+            return forge.cmd_build(args)
+        return build
+
+    def test_miss_builds_and_caches_a_copy(self, sphinx: FakeSphinx,
+                                           build: Callable[..., int]) -> None:
+        assert build("a") == 0
+        assert len(sphinx.calls) == 1
+
+        output = forge.BUILD_DIR / "html" / "index.html"
+        cached = forge.OUTPUT_CACHE_DIR / "a" / "html" / "index.html"
+        assert cached.read_text() == "first"
+        assert not (cached.parent / forge._CACHE_MARKER).exists()
+        assert not output.samefile(cached)
+
+    def test_hit_restores_without_sphinx(self, sphinx: FakeSphinx,
+                                         build: Callable[..., int]) -> None:
+        build("a")
+        sphinx.page = "second"
+        build("b")
+        ran = len(sphinx.calls)
+
+        assert build("b") == 0
+        assert len(sphinx.calls) == ran
+
+        # "a" was evicted by "b", so going back to it is a real build again
+        assert build("a") == 0
+        assert len(sphinx.calls) == ran + 1
+
+    def test_latest_entry_is_restored(self, sphinx: FakeSphinx,
+                                      build: Callable[..., int]) -> None:
+        build("a")
+        (forge.BUILD_DIR / "html" / "index.html").write_text("edited by hand")
+        (forge.BUILD_DIR / "html" / forge._CACHE_MARKER).unlink()
+
+        assert build("a") == 0
+        assert len(sphinx.calls) == 1
+        assert (forge.BUILD_DIR / "html" / "index.html").read_text() == "first"
+
+    def test_only_the_latest_entry_is_kept(self, sphinx: FakeSphinx,
+                                           build: Callable[..., int]) -> None:
+        build("a")
+        build("b")
+        assert [entry.name for entry in forge.OUTPUT_CACHE_DIR.iterdir()] == ["b"]
+
+    def test_cache_is_opt_in(self, sphinx: FakeSphinx,
+                             build: Callable[..., int]) -> None:
+        assert build("a", output_cache=False) == 0
+        assert build("a", output_cache=False) == 0
+        assert len(sphinx.calls) == 1
+        assert not forge.OUTPUT_CACHE_DIR.exists()
+
+    def test_every_build_runs_sphinx_by_default(self, sphinx: FakeSphinx,
+                                                build: Callable[..., int]) -> None:
+        assert build("a", output_cache=False, skip_unchanged=False) == 0
+        assert build("a", output_cache=False, skip_unchanged=False) == 0
+        assert len(sphinx.calls) == 2
+
+    def test_rebuild_keeps_the_previous_output(self, sphinx: FakeSphinx,
+                                               build: Callable[..., int]) -> None:
+        build("a")
+        incremental = forge.BUILD_DIR / "html" / "_static" / "kept.css"
+        incremental.parent.mkdir()
+        incremental.write_text("")
+
+        sphinx.page = "second"
+        assert build("b") == 0
+        assert incremental.exists()
+        assert (forge.BUILD_DIR / "html" / "index.html").read_text() == "second"
+
+
+class TestDoctreeSeeding:
+    """Only formats that really build get a doctree copy, and a failed copy is not fatal."""
+
+    def test_up_to_date_formats_are_not_seeded(self, docs_tree: Path,
+                                               monkeypatch: pytest.MonkeyPatch) -> None:
+        sphinx = FakeSphinx()
+        monkeypatch.setattr(forge, "_sphinx", sphinx)
+        monkeypatch.setattr(forge, "_source_key", lambda roots=None: "k")
+        forge.DOCTREES_DIR.mkdir(parents=True)
+        (forge.DOCTREES_DIR / "environment.pickle").write_text("")
+        html = forge.BUILD_DIR / "html"
+        html.mkdir()
+        (html / forge._CACHE_MARKER).write_text("k")
+
+        args = argparse.Namespace(formats=["html", "epub"], skip_unchanged=True, subprocess=True)
+        assert forge.cmd_build(args) == 0
+        assert [call[-1] for call in sphinx.calls] == [str(forge.BUILD_DIR / "epub")]
+        assert not (forge.BUILD_DIR / "doctrees-epub").exists()
+
+    def test_reuse_is_decided_once(self, docs_tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        sphinx = FakeSphinx()
+        monkeypatch.setattr(forge, "_sphinx", sphinx)
+        monkeypatch.setattr(forge, "_source_key", lambda roots=None: "k")
+        restores: List[str] = []
+        restore = forge._restore_cached
+        monkeypatch.setattr(forge, "_restore_cached",
+                            lambda fmt, key, build_dir: restores.append(fmt) or restore(fmt, key, build_dir))
+
+        args = argparse.Namespace(formats=["html"], output_cache=True, subprocess=True)
+        assert forge.cmd_build(args) == 0
+        assert restores == ["html"]
+        assert len(sphinx.calls) == 1
+
+    def test_copy_failure_leaves_an_empty_cache(self, docs_tree: Path,
+                                                monkeypatch: pytest.MonkeyPatch) -> None:
+        forge.DOCTREES_DIR.mkdir(parents=True)
+        (forge.DOCTREES_DIR / "environment.pickle").write_text("")
+
+        def broken_copy(source: Path, target: Path, **kwargs: object) -> None:
+            Path(target).mkdir(parents=True)
+            (Path(target) / "environment.pickle").write_text("trunc")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(forge.shutil, "copytree", broken_copy)
+        doctrees = forge._seed_doctrees("epub")
+        assert doctrees == forge.BUILD_DIR / "doctrees-epub"
+        assert not doctrees.exists()
+
+
+class TestRemoveTree:
+    """Batched deletion removes exactly the tree - never what its symlinks point at."""
+
+    @staticmethod
+    def populate(root: Path, dirs: int = 3, files: int = 10) -> None:
+        for d in range(dirs):
+            nested = root / f"d{d}" / "nested"
+            nested.mkdir(parents=True)
+            for f in range(files):
+                (nested / f"f{f}.txt").write_text("x")
+                (nested.parent / f"g{f}.txt").write_text("y")
+
+    def test_nested_tree_is_removed(self, tmp_path: Path) -> None:
+        root = tmp_path / "tree"
+        self.populate(root)
+        forge._remove_tree(root)
+        assert not root.exists()
+
+    @pytest.mark.parametrize("unlink_at", [True, False])
+    def test_many_batches(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+                          unlink_at: bool) -> None:
+        # A tiny batch size splits one directory across batches and batches across threads
+        monkeypatch.setattr(forge, "_UNLINK_BATCH", 4)
+        monkeypatch.setattr(forge, "_UNLINK_AT", unlink_at and forge._UNLINK_AT)
+        root = tmp_path / "tree"
+        self.populate(root, dirs=4, files=25)
+        forge._remove_tree(root)
+        assert not root.exists()
+
+    def test_symlinks_are_not_followed(self, tmp_path: Path) -> None:
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        root = tmp_path / "tree"
+        self.populate(root, dirs=1, files=2)
+        (root / "dir-link").symlink_to(outside, target_is_directory=True)
+        (root / "file-link").symlink_to(outside / "keep.txt")
+
+        forge._remove_tree(root)
+        assert not root.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_missing_root_is_a_no_op(self, tmp_path: Path) -> None:
+        forge._remove_tree(tmp_path / "absent")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_removed_dirs_are_recreated_on_demand(self, tmp_path: Path) -> None:
+        target = tmp_path / "tree" / "html"
+        forge._ensure_dir_once(target)
+        forge._remove_tree(tmp_path / "tree")
+        forge._ensure_dir_once(target)
+        assert target.is_dir()
+
+    def test_unlink_batch_skips_vanished_files(self, tmp_path: Path) -> None:
+        (tmp_path / "a").write_text("")
+        forge._unlink_batch([(str(tmp_path), ["a", "gone"]), (str(tmp_path / "no-dir"), ["b"])])
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestInProcessRuns:
+    """Queued in-process runs each write to the real streams, never to a finished run."""
+
+    def test_waiting_run_does_not_tee_into_the_active_one(self,
+                                                          monkeypatch: pytest.MonkeyPatch) -> None:
+        tees: List[object] = []
+
+        class RecordingWriter(forge._TailWriter):
+            def __init__(self, tee=None, **kwargs) -> None:
+                tees.append(tee)
+                super().__init__(tee, **kwargs)
+
+        monkeypatch.setattr(forge, "_TailWriter", RecordingWriter)
+        running, release = threading.Event(), threading.Event()
+
+        def first() -> None:
+            running.set()
+            release.wait(5)
+
+        worker = threading.Thread(target=forge._run_inproc, args=(first, ["first"]))
+        worker.start()
+        running.wait(5)
+        second = threading.Thread(target=forge._run_inproc,
+                                  args=(lambda: print("second"), ["second"]))
+        second.start()
+        time.sleep(0.05)  # Let the second run queue up on the lock
+        release.set()
+        worker.join(5)
+        second.join(5)
+
+        assert len(tees) == 4
+        assert not any(isinstance(tee, RecordingWriter) for tee in tees)
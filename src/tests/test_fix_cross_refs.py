@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# 🌀 Test module for the cross-reference fixer with Eidosian precision
+"""
+Tests for ``fix_cross_refs.fix_file_references``.
+
+One alternation qualifies every role and field reference; these pin down
+what it rewrites and what it must leave alone.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from doc_forge.fix_cross_refs import fix_file_references
+
+MODULE = "ollama_forge.exceptions"
+
+
+@pytest.fixture
+def rst_file(tmp_path: Path) -> Path:
+    return tmp_path / "page.rst"
+
+
+class TestExceptionReferences:
+    """Ambiguous exception references gain their module, in every supported shape."""
+
+    def test_roles_are_qualified(self, rst_file: Path) -> None:
+        content = "See :class:`ServerError` or :exc:`APIError`.\n"
+        assert fix_file_references(rst_file, content) == \
+            f"See :class:`{MODULE}.ServerError` or :class:`{MODULE}.APIError`.\n"
+
+    def test_raises_fields_are_qualified(self, rst_file: Path) -> None:
+        content = ":raises TimeoutError: when the server is slow\n"
+        assert fix_file_references(rst_file, content) == \
+            f":raises {MODULE}.TimeoutError: when the server is slow\n"
+
+    def test_back_to_back_raises_are_both_qualified(self, rst_file: Path) -> None:
+        content = ":raises ServerError:raises ServerError: twice\n"
+        assert fix_file_references(rst_file, content) == \
+            f":raises {MODULE}.ServerError:raises {MODULE}.ServerError: twice\n"
+
+    def test_raises_colon_can_open_a_role(self, rst_file: Path) -> None:
+        content = ":raises APIError:exc:`ServerError`\n"
+        assert fix_file_references(rst_file, content) == \
+            f":raises {MODULE}.APIError:class:`{MODULE}.ServerError`\n"
+
+    def test_builtins_are_left_alone(self, rst_file: Path) -> None:
+        content = ":exc:`ValueError` and :raises TypeError: stay as they are\n"
+        assert fix_file_references(rst_file, content) == content
+        assert not rst_file.exists()
+
+    def test_changes_are_written(self, rst_file: Path) -> None:
+        rst_file.write_text(":exc:`APIError`\n", encoding="utf-8")
+        fix_file_references(rst_file)
+        assert rst_file.read_text(encoding="utf-8") == f":class:`{MODULE}.APIError`\n"
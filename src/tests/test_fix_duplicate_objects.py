@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# 🌀 Test module for the duplicate object harmonizer with Eidosian precision
+"""
+Tests for ``DuplicateObjectHarmonizer``.
+
+AutoAPI copies of objects already documented by hand get ``:noindex:`` -
+exactly once, whatever characters their signatures contain.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from doc_forge.fix_duplicate_objects import DuplicateObjectHarmonizer
+
+
+@pytest.fixture
+def docs(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    (docs / "autoapi").mkdir(parents=True)
+    (docs / "api.rst").write_text(".. py:function:: pkg.run(a, b=1)\n")
+    return docs
+
+
+class TestNoindex:
+    """The canonical description stays indexed; AutoAPI duplicates are marked once."""
+
+    def test_duplicate_is_marked(self, docs: Path) -> None:
+        page = docs / "autoapi" / "pkg.rst"
+        page.write_text(".. py:function:: pkg.run(a, b=1)\n")
+
+        assert DuplicateObjectHarmonizer(docs).fix_duplicate_objects() == 1
+        assert page.read_text() == ".. py:function:: pkg.run(a, b=1) :noindex:\n"
+        assert (docs / "api.rst").read_text() == ".. py:function:: pkg.run(a, b=1)\n"
+
+    @pytest.mark.parametrize("signature",
+                             ["pkg.run(a, b=1)", "pkg.run(*args, **kwargs)", "pkg.run()"])
+    def test_signature_with_parentheses_is_not_marked_twice(self, docs: Path,
+                                                            signature: str) -> None:
+        (docs / "api.rst").write_text(f".. py:function:: {signature}\n")
+        page = docs / "autoapi" / "pkg.rst"
+        marked = f".. py:function:: {signature} :noindex:\n"
+        page.write_text(marked)
+
+        assert DuplicateObjectHarmonizer(docs).fix_duplicate_objects() == 0
+        assert page.read_text() == marked
+
+    def test_second_run_changes_nothing(self, docs: Path) -> None:
+        (docs / "autoapi" / "pkg.rst").write_text(".. py:function:: pkg.run(a, b=1)\n")
+        DuplicateObjectHarmonizer(docs).fix_duplicate_objects()
+        assert DuplicateObjectHarmonizer(docs).fix_duplicate_objects() == 0
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# 🌀 Test module for the forge_docs pipeline with Eidosian precision
+"""
+Tests for the ``forge_docs`` stage cache.
+
+Every stage is replaced by a recording fake, so these tests pin down which
+stages run and which are skipped, not what the fixers do to the docs.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+import doc_forge
+import doc_forge.doc_validator
+import doc_forge.fix_cross_refs
+import doc_forge.fix_docstrings
+import doc_forge.fix_duplicate_objects
+import doc_forge.fix_inline_refs
+import doc_forge.fix_rst_syntax
+import doc_forge.update_toctrees
+
+
+class Stages:
+    """Recording fakes for every forge_docs stage; the TOC stage can rewrite a file."""
+
+    def __init__(self, docs: Path) -> None:
+        self.docs = docs
+        self.ran: List[str] = []
+        self.toc_rewrites = False
+
+    def toc(self, docs_dir: Path) -> int:
+        self.ran.append("toc")
+        if self.toc_rewrites:
+            index = self.docs / "index.rst"
+            index.write_text(index.read_text() + "\n.. toctree::\n")
+            info = index.stat()
+            os.utime(index, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+        return 1
+
+    def refs(self, docs_dir: Path, doc_files: Any = None) -> int:
+        self.ran.append("refs")
+        return 0
+
+    def validate(self, repo_root: Path) -> dict:
+        self.ran.append("validate")
+        return {}
+
+    def fixer(self, stage: str, method: str) -> type:
+        ran = self.ran
+        return type(stage, (), {
+            "__init__": lambda fixer, docs_dir: None,
+            method: lambda fixer, *args: ran.append(stage) or 0,
+        })
+
+
+@pytest.fixture
+def stages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Stages:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "index.rst").write_text("Index\n=====\n")
+    fake = Stages(docs)
+    monkeypatch.setattr(doc_forge, "_STAGE_CACHE", tmp_path / "cache" / "stages.json")
+    monkeypatch.setattr(doc_forge.update_toctrees, "update_toctrees", fake.toc)
+    monkeypatch.setattr(doc_forge.fix_inline_refs, "fix_inline_references", fake.refs)
+    monkeypatch.setattr(doc_forge.fix_cross_refs, "fix_ambiguous_references", lambda root: None)
+    monkeypatch.setattr(doc_forge.doc_validator, "validate_docs", fake.validate)
+    monkeypatch.setattr(doc_forge.fix_rst_syntax, "RstSyntaxPerfector",
+                        fake.fixer("syntax", "fix_inline_text_issues"))
+    monkeypatch.setattr(doc_forge.fix_docstrings, "DocstringFixer",
+                        fake.fixer("docstrings", "fix_all_files"))
+    monkeypatch.setattr(doc_forge.fix_duplicate_objects, "DuplicateObjectHarmonizer",
+                        fake.fixer("duplicates", "fix_duplicate_objects"))
+    return fake
+
+
+ALL_STAGES = ["toc", "refs", "syntax", "docstrings", "duplicates", "validate"]
+
+
+class TestStageCache:
+    """Only docs-only stages are memoized, only on request, against the tree as it stands."""
+
+    def test_cache_is_opt_in(self, stages: Stages) -> None:
+        assert doc_forge.forge_docs(stages.docs)
+        assert doc_forge.forge_docs(stages.docs)
+        assert stages.ran == ALL_STAGES * 2
+        assert not doc_forge._STAGE_CACHE.exists()
+
+    def test_refs_and_validate_always_run(self, stages: Stages) -> None:
+        assert doc_forge.forge_docs(stages.docs, use_cache=True)
+        stages.ran.clear()
+
+        assert doc_forge.forge_docs(stages.docs, use_cache=True)
+        assert stages.ran == ["refs", "validate"]
+
+    def test_rewrite_by_an_earlier_stage_reruns_later_ones(self, stages: Stages) -> None:
+        assert doc_forge.forge_docs(stages.docs, fix_toc=False, use_cache=True)
+        stages.ran.clear()
+
+        stages.toc_rewrites = True
+        assert doc_forge.forge_docs(stages.docs, use_cache=True)
+        assert stages.ran == ALL_STAGES
+
+    def test_edited_docs_rerun_every_stage(self, stages: Stages) -> None:
+        assert doc_forge.forge_docs(stages.docs, use_cache=True)
+        stages.ran.clear()
+
+        page = stages.docs / "page.md"
+        page.write_text("# Page\n")
+        assert doc_forge.forge_docs(stages.docs, use_cache=True)
+        assert stages.ran == ALL_STAGES